@@ -0,0 +1,290 @@
+# --- Read-through cache tier ---
+# Wraps an engine's point_lookup / latest_n with an application cache, the way
+# production reads reach the database:
+#
+#   tier = ReadThroughCache(LRUCache(max_items=10_000), ttl_s=30)
+#   conn = tier.wrap(open_engine("cockroachdb"))   # one per worker thread
+#   conn.latest_n(user_id, 20); conn.last_hit()    # True / False
+#
+# Backends share one interface (get / set / delete / close):
+#   LRUCache   in-process, bounded, optional TTL, thread-safe
+#   RespCache  Redis-protocol client (GET, SET PX, DEL) over TCP; points at
+#              REDIS_URL (a real Redis) or at RespServer, a local stand-in
+# With invalidate=True the wrapped write paths (update_post, insert_posts,
+# bulk_update, cascade_delete) delete the entries they make stale. Owners are
+# learned when results are cached (post -> user, user -> username), so no
+# extra DB reads are needed, but only within one process: several processes
+# sharing a RespServer/Redis see each other's entries, not invalidations.
+# ------------------------------------------
+
+import os, pickle, socket, socketserver, threading
+from collections import OrderedDict
+from time import monotonic
+
+MISS = object()
+
+
+class LRUCache:
+    def __init__(self, max_items=10_000):
+        self.max_items = max_items
+        self._data = OrderedDict()  # key -> (expires_at or None, value)
+        self._lock = threading.Lock()
+        self.evictions = self.expirations = 0
+
+    def get(self, key):
+        with self._lock:
+            entry = self._data.get(key)
+            if entry is None:
+                return MISS
+            expires, value = entry
+            if expires is not None and expires <= monotonic():
+                del self._data[key]
+                self.expirations += 1
+                return MISS
+            self._data.move_to_end(key)
+            return value
+
+    def set(self, key, value, ttl_s=None):
+        with self._lock:
+            self._data[key] = (monotonic() + ttl_s if ttl_s else None, value)
+            self._data.move_to_end(key)
+            while len(self._data) > self.max_items:
+                self._data.popitem(last=False)
+                self.evictions += 1
+
+    def delete(self, keys):
+        with self._lock:
+            for k in keys:
+                self._data.pop(k, None)
+
+    def stats(self):
+        return {"backend": "lru", "items": len(self._data), "max_items": self.max_items,
+                "evictions": self.evictions, "expirations": self.expirations}
+
+    def close(self):
+        pass
+
+
+# ---------------------------- Redis protocol ----------------------------
+def _encode(*args):
+    out = [b"*%d\r\n" % len(args)]
+    for a in args:
+        a = a if isinstance(a, bytes) else str(a).encode()
+        out.append(b"$%d\r\n%s\r\n" % (len(a), a))
+    return b"".join(out)
+
+
+def _read_reply(f):
+    line = f.readline()
+    kind, rest = line[:1], line[1:-2]
+    if kind in (b"+", b":"):
+        return rest
+    if kind == b"-":
+        raise RuntimeError(rest.decode())
+    if kind == b"$":
+        n = int(rest)
+        return None if n < 0 else f.read(n + 2)[:-2]
+    if kind == b"*":
+        return [_read_reply(f) for _ in range(int(rest))]
+    raise ConnectionError("connection closed" if not line else f"bad reply {line!r}")
+
+
+class RespCache:
+    # One socket per calling thread; values are pickled (a real cache stores bytes)
+    def __init__(self, url=None, prefix="bench"):
+        url = url or os.environ.get("REDIS_URL", "redis://127.0.0.1:6379")
+        host, _, port = url.split("://", 1)[-1].rstrip("/").rpartition(":")
+        self.addr, self.prefix = (host, int(port)), prefix
+        self._local = threading.local()
+        self._socks, self._lock = [], threading.Lock()
+
+    def _call(self, *args):
+        conn = getattr(self._local, "conn", None)
+        if conn is None:
+            sock = socket.create_connection(self.addr)
+            sock.setsockopt(socket.IPPROTO_TCP, socket.TCP_NODELAY, 1)
+            conn = self._local.conn = (sock, sock.makefile("rb"))
+            with self._lock:
+                self._socks.append(sock)
+        conn[0].sendall(_encode(*args))
+        return _read_reply(conn[1])
+
+    def get(self, key):
+        raw = self._call("GET", f"{self.prefix}:{key}")
+        return MISS if raw is None else pickle.loads(raw)
+
+    def set(self, key, value, ttl_s=None):
+        args = ("SET", f"{self.prefix}:{key}", pickle.dumps(value))
+        self._call(*(args + ("PX", int(ttl_s * 1000)) if ttl_s else args))
+
+    def delete(self, keys):
+        keys = [f"{self.prefix}:{k}" for k in keys]
+        if keys:
+            self._call("DEL", *keys)
+
+    def stats(self):
+        return {"backend": "resp", "addr": f"{self.addr[0]}:{self.addr[1]}"}
+
+    def close(self):
+        with self._lock:
+            for s in self._socks:
+                s.close()
+            self._socks.clear()
+
+
+class RespServer(socketserver.ThreadingTCPServer):
+    # Local Redis-protocol stand-in: GET, SET [PX ms], DEL, PING on a dict.
+    # Not Redis (single process, no eviction), but a real network hop and
+    # serialization, which is what the cache tier pays per lookup.
+    daemon_threads = True
+    allow_reuse_address = True
+
+    def __init__(self, host="127.0.0.1", port=0):
+        self.data, self.data_lock = {}, threading.Lock()
+        super().__init__((host, port), _RespHandler)
+
+    @property
+    def url(self):
+        return "redis://%s:%d" % self.server_address
+
+    def start(self):
+        threading.Thread(target=self.serve_forever, daemon=True).start()
+        return self
+
+    def stop(self):
+        self.shutdown()
+        self.server_close()
+
+
+class _RespHandler(socketserver.StreamRequestHandler):
+    def setup(self):
+        super().setup()
+        self.connection.setsockopt(socket.IPPROTO_TCP, socket.TCP_NODELAY, 1)
+
+    def handle(self):
+        data, lock = self.server.data, self.server.data_lock
+        while True:
+            try:
+                args = _read_reply(self.rfile)
+            except (ConnectionError, ValueError):
+                return
+            cmd = args[0].upper()
+            with lock:
+                if cmd == b"GET":
+                    entry = data.get(args[1])
+                    if entry is not None and entry[0] is not None and entry[0] <= monotonic():
+                        del data[args[1]]
+                        entry = None
+                    reply = b"$-1\r\n" if entry is None else b"$%d\r\n%s\r\n" % (len(entry[1]), entry[1])
+                elif cmd == b"SET":
+                    px = int(args[4]) if len(args) > 4 and args[3].upper() == b"PX" else None
+                    data[args[1]] = (monotonic() + px / 1000.0 if px else None, args[2])
+                    reply = b"+OK\r\n"
+                elif cmd == b"DEL":
+                    reply = b":%d\r\n" % sum(data.pop(k, None) is not None for k in args[1:])
+                elif cmd == b"PING":
+                    reply = b"+PONG\r\n"
+                else:
+                    reply = b"-ERR unknown command\r\n"
+            self.wfile.write(reply)
+            self.wfile.flush()
+
+
+# ---------------------------- Read-through tier ----------------------------
+def _row_field(row, field, pos):
+    return row[field] if isinstance(row, dict) else row[pos]
+
+
+def _freeze(value):
+    # Copy rows so in-process caches do not alias the stand-ins' live documents
+    if isinstance(value, list):
+        return [dict(r) if isinstance(r, dict) else r for r in value]
+    return dict(value) if isinstance(value, dict) else value
+
+
+class ReadThroughCache:
+    def __init__(self, backend, ttl_s=None, invalidate=True):
+        self.backend, self.ttl_s, self.invalidate = backend, ttl_s, invalidate
+        self._owner = {}     # post id -> user id (from cached latest_n results)
+        self._username = {}  # user id -> username (from cached point lookups)
+        self._ns = set()     # latest_n page sizes seen
+        self._lock = threading.Lock()
+
+    def wrap(self, engine):
+        return CachedEngine(engine, self)
+
+    def learn(self, user_id=None, username=None, post_ids=(), n=None):
+        with self._lock:
+            if username is not None:
+                self._username[user_id] = username
+            for pid in post_ids:
+                self._owner[pid] = user_id
+            if n is not None:
+                self._ns.add(n)
+
+    def keys_for(self, user_ids=(), post_ids=()):
+        with self._lock:
+            users = set(user_ids) | {self._owner[p] for p in post_ids if p in self._owner}
+            keys = [f"latest:{u}:{n}" for u in users for n in self._ns]
+            keys += [f"user:{self._username[u]}" for u in users if u in self._username]
+        return keys
+
+    def drop(self, user_ids=(), post_ids=()):
+        if self.invalidate:
+            self.backend.delete(self.keys_for(user_ids, post_ids))
+
+
+class CachedEngine:
+    # Engine proxy: cached reads, invalidating writes, everything else passed through
+    def __init__(self, engine, tier):
+        self.engine, self.tier = engine, tier
+        self._local = threading.local()
+
+    def __getattr__(self, attr):
+        return getattr(self.engine, attr)
+
+    def last_hit(self):
+        return getattr(self._local, "hit", False)
+
+    def _read_through(self, key, load, learn):
+        value = self.tier.backend.get(key)
+        self._local.hit = value is not MISS
+        if value is MISS:
+            value = load()
+            if value is not None:
+                self.tier.backend.set(key, _freeze(value), self.tier.ttl_s)
+                learn(value)
+        return value
+
+    def point_lookup(self, username):
+        return self._read_through(
+            f"user:{username}", lambda: self.engine.point_lookup(username),
+            lambda row: self.tier.learn(_row_field(row, "_id", 0), username),
+        )
+
+    def latest_n(self, user_id, n=20):
+        return self._read_through(
+            f"latest:{user_id}:{n}", lambda: self.engine.latest_n(user_id, n),
+            lambda rows: self.tier.learn(user_id, post_ids=[_row_field(r, "_id", 0) for r in rows], n=n),
+        )
+
+    def update_post(self, post_id, content):
+        self.engine.update_post(post_id, content)
+        self.tier.drop(post_ids=[post_id])
+
+    def insert_posts(self, posts, mode="batched", returning=False):
+        posts = list(posts)
+        ids = self.engine.insert_posts(posts, mode, returning)
+        self.tier.drop(user_ids={p["user_id"] for p in posts})
+        return ids
+
+    def bulk_update(self, table, field, pairs):
+        pairs = list(pairs)
+        self.engine.bulk_update(table, field, pairs)
+        ids = [i for i, _ in pairs]
+        self.tier.drop(**({"post_ids": ids} if table == "posts" else {"user_ids": ids}))
+
+    def cascade_delete(self, user_ids):
+        user_ids = list(user_ids)
+        self.engine.cascade_delete(user_ids)
+        self.tier.drop(user_ids=user_ids)
@@ -0,0 +1,188 @@
+# --- Scale-factor data generator (streams batches, never the full table) ---
+# Rows are produced in fixed-size chunks, each from its own NumPy RNG seeded
+# by (seed, stream, chunk index). The output is therefore identical across
+# runs, across engines and across batch sizes, and any row range can be
+# regenerated on its own (e.g. one shard per writer) without the rows before it.
+#
+# Post content is sampled from a vocabulary pregenerated once with Faker and
+# timestamps are drawn vectorized, so generation stays far cheaper than the
+# inserts being measured. The follower graph and likes are power-law: a few
+# celebrity accounts/posts take most of the follows/likes.
+#
+# Scripts size the dataset TPC-style with --scale N (or SCALE=N), e.g.
+# N_USERS = 1000 * N.
+# ------------------------------------------
+
+import os, argparse
+from datetime import datetime
+import numpy as np
+from faker import Faker
+from distributions import KeyDistribution
+
+CHUNK_ROWS = 10_000     # rows per RNG chunk (independent of the insert batch size)
+VOCAB_SIZE = 5_000
+CONTENT_WORDS = (5, 30) # words per post, inclusive
+DAYS = 14               # created_at spread: within the last DAYS days of `anchor`
+AVG_FOLLOWS = 30        # mean accounts followed per user (before dedup)
+PARETO_ALPHA = 2.0      # out-degree tail; in-degree follows a Zipfian popularity
+
+
+def add_scale_arg(parser: argparse.ArgumentParser) -> argparse.ArgumentParser:
+    parser.add_argument(
+        "--scale", type=float, default=float(os.environ.get("SCALE", "1")),
+        help="scale factor; 1 reproduces the original fixture sizes (default: $SCALE or 1)",
+    )
+    return parser
+
+
+def batched(iterable, size):
+    batch = []
+    for item in iterable:
+        batch.append(item)
+        if len(batch) == size:
+            yield batch
+            batch = []
+    if batch:
+        yield batch
+
+
+def bind_users(batches, user_ids):
+    # Map the engine-neutral user_idx to one engine's ids (Mongo _id, SQL serial id).
+    for batch in batches:
+        yield [_bind_post(p, user_ids) for p in batch]
+
+
+def _bind_post(p, user_ids):
+    post = {"user_id": user_ids[p["user_idx"]], "content": p["content"], "created_at": p["created_at"]}
+    if "meta" in p:
+        post["meta"] = p["meta"]
+    return post
+
+
+def bind_comments(batches, user_ids, post_ids):
+    for batch in batches:
+        yield [{"post_id": post_ids[c["post_idx"]], "user_id": user_ids[c["user_idx"]],
+                "content": c["content"], "created_at": c["created_at"]} for c in batch]
+
+
+class Dataset:
+    def __init__(self, n_users, n_posts, seed=42, prefix="user", anchor=None, chunk_rows=CHUNK_ROWS,
+                 content_bytes=None, meta_bytes=0):
+        # content_bytes: pad/cut every post's content to exactly this size;
+        # meta_bytes: attach a ~meta_bytes JSON "meta" (media metadata) blob.
+        self.n_users, self.n_posts = int(n_users), int(n_posts)
+        self.seed, self.prefix, self.chunk_rows = seed, prefix, chunk_rows
+        self.content_bytes, self.meta_bytes = content_bytes, meta_bytes
+        # Truncated to the hour so reruns within the hour produce identical rows
+        self.anchor = anchor or datetime.utcnow().replace(minute=0, second=0, microsecond=0)
+        fake = Faker()
+        fake.seed_instance(seed)
+        self.vocab = np.array(fake.words(nb=VOCAB_SIZE), dtype=object)
+
+    # ---------- Users ----------
+    def users(self, batch_size=1000, email=True):
+        for lo in range(0, self.n_users, batch_size):
+            batch = []
+            for i in range(lo, min(lo + batch_size, self.n_users)):
+                u = {"username": f"{self.prefix}_{self.seed}_{i}"}
+                if email:
+                    u["email"] = f"{self.prefix}_{self.seed}_{i}@example.com"
+                batch.append(u)
+            yield batch
+
+    # ---------- Posts ----------
+    def _content(self, rng, n):
+        n_words = rng.integers(CONTENT_WORDS[0], CONTENT_WORDS[1] + 1, n)
+        words = self.vocab[rng.integers(0, len(self.vocab), int(n_words.sum()))].tolist()
+        ends = np.cumsum(n_words).tolist()
+        return [" ".join(words[a:b]) for a, b in zip([0] + ends[:-1], ends)]
+
+    def _created(self, rng, n):
+        offsets = rng.integers(0, DAYS * 24 * 3600, n).astype("timedelta64[s]")
+        return (np.datetime64(self.anchor, "s") - offsets).astype("datetime64[us]").tolist()
+
+    def _chunk(self, k, stream, user_idx):
+        # Always a full chunk, so its rows never depend on where a range stops
+        n = self.chunk_rows
+        rng = np.random.default_rng([self.seed, stream, k])
+        if user_idx is None:
+            uidx = rng.integers(0, self.n_users, n).tolist()
+        else:
+            uidx = [user_idx] * n
+        content = self._content(rng, n)
+        created = self._created(rng, n)
+        if self.content_bytes:
+            size = self.content_bytes
+            content = [((c + " ") * (size // (len(c) + 1) + 1))[:size] for c in content]
+        meta = self._meta(rng, n) if self.meta_bytes else None
+        return uidx, content, created, meta
+
+    def _meta(self, rng, n):
+        # Media attachments, ~128 JSON bytes each, enough to reach meta_bytes
+        k = max(int(round(self.meta_bytes / 128)), 1)
+        ids = rng.integers(0, 2**62, (n, k)).tolist()
+        dims = rng.integers(240, 4096, (n, k, 2)).tolist()
+        sizes = rng.integers(10_000, 5_000_000, (n, k)).tolist()
+        return [
+            {"media": [{"url": f"https://cdn.example.com/m/{ids[i][j]:016x}.jpg", "width": dims[i][j][0],
+                        "height": dims[i][j][1], "mime": "image/jpeg", "bytes": sizes[i][j]} for j in range(k)]}
+            for i in range(n)
+        ]
+
+    def iter_posts(self, start=0, stop=None, stream=0, user_idx=None):
+        # Row-at-a-time view over rows [start, stop) of a stream.
+        stop = self.n_posts if stop is None else stop
+        c = self.chunk_rows
+        for k in range(start // c, (stop + c - 1) // c):
+            lo = k * c
+            uidx, content, created, meta = self._chunk(k, stream, user_idx)
+            for j in range(max(start - lo, 0), min(stop - lo, c)):
+                row = {"user_idx": uidx[j], "content": content[j], "created_at": created[j]}
+                if meta is not None:
+                    row["meta"] = meta[j]
+                yield row
+
+    def posts(self, batch_size=1000, start=0, stop=None, stream=0, user_idx=None):
+        return batched(self.iter_posts(start, stop, stream, user_idx), batch_size)
+
+    # ---------- Comments ----------
+    def iter_comments(self, n_comments, stream=0):
+        # {"post_idx", "user_idx", "content", "created_at"}: uniform commenters,
+        # Zipfian post popularity (a few posts draw most of the comments).
+        popularity = KeyDistribution("zipfian", scramble=True)
+        c = self.chunk_rows
+        for k in range((n_comments + c - 1) // c):
+            rng = np.random.default_rng([self.seed, 2000 + stream, k])
+            pidx = popularity.sample(self.n_posts, c, rng).tolist()
+            uidx = rng.integers(0, self.n_users, c).tolist()
+            content, created = self._content(rng, c), self._created(rng, c)
+            for j in range(min(c, n_comments - k * c)):
+                yield {"post_idx": pidx[j], "user_idx": uidx[j], "content": content[j], "created_at": created[j]}
+
+    def comments(self, n_comments, batch_size=1000, stream=0):
+        return batched(self.iter_comments(n_comments, stream), batch_size)
+
+    # ---------- Social graph ----------
+    # Both return engine-neutral index arrays (bind them to one engine's ids).
+    def follows(self, avg_follows=AVG_FOLLOWS):
+        # (follower_idx, followee_idx): Pareto out-degree with mean ~avg_follows,
+        # followees drawn from a scrambled Zipfian so in-degree is power-law too.
+        # Self-follows and duplicate edges are dropped.
+        n = self.n_users
+        rng = np.random.default_rng([self.seed, 1000])
+        x_min = avg_follows * (PARETO_ALPHA - 1) / PARETO_ALPHA
+        degree = np.clip((rng.pareto(PARETO_ALPHA, n) + 1) * x_min, 1, n - 1).astype(np.int64)
+        follower = np.repeat(np.arange(n), degree)
+        followee = KeyDistribution("zipfian", scramble=True).sample(n, len(follower), rng)
+        edges = np.unique(follower * n + followee)
+        follower, followee = edges // n, edges % n
+        keep = follower != followee
+        return follower[keep], followee[keep]
+
+    def likes(self, n_likes):
+        # (user_idx, post_idx): uniform users, Zipfian post popularity, deduplicated.
+        rng = np.random.default_rng([self.seed, 1001])
+        user = rng.integers(0, self.n_users, n_likes)
+        post = KeyDistribution("zipfian", scramble=True).sample(self.n_posts, n_likes, rng)
+        pairs = np.unique(post * self.n_users + user)
+        return pairs % self.n_users, pairs // self.n_users
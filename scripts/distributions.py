@@ -0,0 +1,99 @@
+# --- Key-access distributions (which user/post each request touches) ---
+# Every workload draws its keys up front as a NumPy index array into its key
+# list (usernames, user ids, post ids), so sampling costs nothing in the timed
+# loop. Key lists are expected in insertion order:
+#   uniform  every key equally likely
+#   zipfian  P(rank r) ~ 1 / r**theta; rank 0 is the first key, so the hot
+#            keys are adjacent (same CockroachDB range) - add --scramble to
+#            spread them over the keyspace with a fixed permutation instead
+#   hotspot  hot_ops of the requests go to the first hot_fraction of the keys
+#   latest   zipfian over recency: the most recently inserted keys are hottest
+# ------------------------------------------
+
+import argparse
+import numpy as np
+
+DISTRIBUTIONS = ("uniform", "zipfian", "hotspot", "latest")
+THETA = 0.99            # YCSB's default Zipfian constant
+HOT_FRACTION = 0.2      # hotspot: share of the keyspace that is hot ...
+HOT_OPS = 0.8           # ... and the share of requests that go to it
+SCRAMBLE_SEED = 0x5EED  # fixed so scrambled hot keys are the same across engines and runs
+
+
+def add_distribution_args(parser: argparse.ArgumentParser) -> argparse.ArgumentParser:
+    parser.add_argument("--distribution", choices=DISTRIBUTIONS, default="uniform", help="key-access distribution")
+    parser.add_argument("--theta", type=float, default=THETA, help="Zipfian skew (zipfian/latest)")
+    parser.add_argument("--hot-fraction", type=float, default=HOT_FRACTION, help="hotspot: hot share of the keys")
+    parser.add_argument("--hot-ops", type=float, default=HOT_OPS, help="hotspot: share of requests on hot keys")
+    parser.add_argument("--scramble", action="store_true", help="zipfian: scatter hot keys over the keyspace")
+    return parser
+
+
+class KeyDistribution:
+    def __init__(self, name="uniform", theta=THETA, hot_fraction=HOT_FRACTION, hot_ops=HOT_OPS, scramble=False):
+        if name not in DISTRIBUTIONS:
+            raise ValueError(f"unknown distribution {name!r} (choose from {', '.join(DISTRIBUTIONS)})")
+        self.name, self.theta = name, theta
+        self.hot_fraction, self.hot_ops, self.scramble = hot_fraction, hot_ops, scramble
+        self._cdfs, self._perms = {}, {}
+
+    @classmethod
+    def from_args(cls, args):
+        return cls(args.distribution, args.theta, args.hot_fraction, args.hot_ops, args.scramble)
+
+    def _zipf_ranks(self, n_keys, size, rng):
+        # Inverse-CDF sampling; the CDF is built once per keyspace size
+        cdf = self._cdfs.get(n_keys)
+        if cdf is None:
+            cdf = np.cumsum(1.0 / np.arange(1, n_keys + 1, dtype=float) ** self.theta)
+            cdf /= cdf[-1]
+            self._cdfs[n_keys] = cdf
+        return np.minimum(np.searchsorted(cdf, rng.random(size), side="right"), n_keys - 1)
+
+    def _scramble(self, n_keys):
+        # The fixed permutation is built once per keyspace size, like the CDF
+        perm = self._perms.get(n_keys)
+        if perm is None:
+            perm = self._perms[n_keys] = np.random.default_rng(SCRAMBLE_SEED).permutation(n_keys)
+        return perm
+
+    def sample(self, n_keys, size, rng):
+        # `size` key indices in [0, n_keys), drawn from numpy Generator rng
+        if n_keys <= 0:
+            raise ValueError("cannot sample from an empty keyspace")
+        if self.name == "uniform":
+            return rng.integers(0, n_keys, size)
+        if self.name == "zipfian":
+            ranks = self._zipf_ranks(n_keys, size, rng)
+            if self.scramble:
+                ranks = self._scramble(n_keys)[ranks]
+            return ranks
+        if self.name == "latest":
+            return n_keys - 1 - self._zipf_ranks(n_keys, size, rng)
+        # hotspot
+        n_hot = min(max(int(n_keys * self.hot_fraction), 1), n_keys)
+        hot = rng.random(size) < self.hot_ops
+        if n_hot == n_keys:
+            return rng.integers(0, n_keys, size)
+        return np.where(hot, rng.integers(0, n_hot, size), rng.integers(n_hot, n_keys, size))
+
+    def to_dict(self):
+        d = {"name": self.name}
+        if self.name in ("zipfian", "latest"):
+            d["theta"] = self.theta
+        if self.name == "zipfian":
+            d["scramble"] = self.scramble
+        if self.name == "hotspot":
+            d.update(hot_fraction=self.hot_fraction, hot_ops=self.hot_ops)
+        return d
+
+
+def skew_summary(keys, n_keys):
+    # How concentrated the drawn keys are: distinct keys touched and the share
+    # of requests that hit the hottest 1% of the keyspace.
+    counts = np.bincount(np.asarray(keys, dtype=np.int64), minlength=n_keys)
+    top = np.sort(counts)[::-1][: max(n_keys // 100, 1)]
+    return {
+        "distinct_keys": int(np.count_nonzero(counts)),
+        "top1pct_share": float(top.sum() / max(counts.sum(), 1)),
+    }
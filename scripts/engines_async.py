@@ -0,0 +1,150 @@
+# --- asyncio engine adapters (Motor / asyncpg) ---
+# Async counterparts of engines.py for driving thousands of in-flight requests
+# from one event loop. Each engine owns a connection pool sized with
+# pool_size; the drivers are optional and imported only when used:
+#   pip install motor asyncpg
+# The in-process stand-ins have no async driver, so they run the sync adapter
+# on a pool of connections in a thread executor.
+# ------------------------------------------
+
+import asyncio
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
+from engines import (MONGO_URI, CR_HOST, CR_PORT, CR_USER, CR_DB, TABLES, AS_OF_FOLLOWER,
+                     consistency_profile, mongo_database_options, open_engine)
+
+
+class AsyncEngine:
+    name = "base"
+
+    def __init__(self, pool_size=100, consistency=None, **tables):
+        # consistency: a CONSISTENCY_PROFILES name, as for the sync adapters
+        self.pool_size = pool_size
+        self.tables = {t: tables.pop(t, t) for t in TABLES}
+        if tables:
+            raise TypeError(f"unknown tables: {sorted(tables)}")
+        self.consistency, self.settings = consistency_profile(self.name, consistency)
+
+    async def connect(self):
+        return self
+
+    async def point_lookup(self, username):
+        raise NotImplementedError
+
+    async def latest_n(self, user_id, n=20):
+        raise NotImplementedError
+
+    async def close(self):
+        pass
+
+
+class AsyncMongoEngine(AsyncEngine):
+    name = "mongodb"
+
+    def __init__(self, uri=MONGO_URI, database="social_media", pool_size=100, consistency=None, **tables):
+        super().__init__(pool_size, consistency, **tables)
+        self.uri, self.database = uri, database
+
+    async def connect(self):
+        from motor.motor_asyncio import AsyncIOMotorClient
+        self.client = AsyncIOMotorClient(self.uri, maxPoolSize=self.pool_size)
+        self.db = self.client.get_database(self.database, **mongo_database_options(self.settings))
+        return self
+
+    async def point_lookup(self, username):
+        return await self.db[self.tables["users"]].find_one({"username": username})
+
+    async def latest_n(self, user_id, n=20):
+        cursor = self.db[self.tables["posts"]].find({"user_id": user_id}).sort("created_at", -1).limit(n)
+        return await cursor.to_list(length=n)
+
+    async def close(self):
+        self.client.close()
+
+
+class AsyncCockroachEngine(AsyncEngine):
+    name = "cockroachdb"
+
+    def __init__(self, host=CR_HOST, port=CR_PORT, user=CR_USER, database=CR_DB, pool_size=100, consistency=None, **tables):
+        super().__init__(pool_size, consistency, **tables)
+        self.dsn = dict(host=host, port=port, user=user, database=database)
+        # asyncpg runs single statements outside explicit transactions, so
+        # AS OF SYSTEM TIME can go straight into the reads
+        self.as_of = f" {AS_OF_FOLLOWER}" if self.settings.get("follower_reads") else ""
+
+    async def connect(self):
+        import asyncpg
+        isolation = self.settings.get("isolation")
+
+        async def init(conn):
+            if isolation:
+                await conn.execute(f"SET default_transaction_isolation = '{isolation}'")
+
+        self.pool = await asyncpg.create_pool(**self.dsn, min_size=self.pool_size, max_size=self.pool_size, init=init)
+        return self
+
+    async def point_lookup(self, username):
+        async with self.pool.acquire() as conn:
+            return await conn.fetchrow(f"SELECT id, username FROM {self.tables['users']}{self.as_of} WHERE username = $1", username)
+
+    async def latest_n(self, user_id, n=20):
+        async with self.pool.acquire() as conn:
+            return await conn.fetch(
+                f"SELECT id, user_id, content, created_at FROM {self.tables['posts']}{self.as_of} "
+                "WHERE user_id = $1 ORDER BY created_at DESC LIMIT $2",
+                user_id, n,
+            )
+
+    async def close(self):
+        await self.pool.close()
+
+
+class ThreadedAsyncEngine(AsyncEngine):
+    # Stand-ins: sync adapter connections checked out under an asyncio.Semaphore
+    # and run on a thread pool of the same size. The semaphore hands a released
+    # slot straight to the longest waiter (Python 3.11.1+), so checkout is FIFO;
+    # an asyncio.Queue lets the releasing task take its connection straight
+    # back, which hides queueing from the tail percentiles.
+    def __init__(self, name, pool_size=100, consistency=None, **tables):
+        self.name = name
+        super().__init__(pool_size, consistency, **tables)
+
+    async def connect(self):
+        self.executor = ThreadPoolExecutor(max_workers=self.pool_size)
+        self.slots = asyncio.Semaphore(self.pool_size)
+        self.conns = deque(open_engine(self.name, consistency=self.consistency, **self.tables)
+                           for _ in range(self.pool_size))
+        return self
+
+    async def _call(self, method, *args):
+        async with self.slots:
+            conn = self.conns.popleft()
+            try:
+                return await asyncio.get_running_loop().run_in_executor(self.executor, getattr(conn, method), *args)
+            finally:
+                self.conns.append(conn)
+
+    async def point_lookup(self, username):
+        return await self._call("point_lookup", username)
+
+    async def latest_n(self, user_id, n=20):
+        return await self._call("latest_n", user_id, n)
+
+    async def close(self):
+        while self.conns:
+            self.conns.popleft().close()
+        self.executor.shutdown()
+
+
+ASYNC_ENGINES = {
+    "mongodb": AsyncMongoEngine,
+    "cockroachdb": AsyncCockroachEngine,
+}
+
+
+async def open_async_engine(name, pool_size=100, **kwargs):
+    if name in ASYNC_ENGINES:
+        engine = ASYNC_ENGINES[name](pool_size=pool_size, **kwargs)
+    else:
+        engine = ThreadedAsyncEngine(name, pool_size=pool_size, **kwargs)
+    return await engine.connect()
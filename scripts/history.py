@@ -0,0 +1,305 @@
+# --- Run history (Parquet) and regression checks ---
+# Every run_*.py appends its results to a columnar history under HISTORY_DIR
+# (default results/history, one Parquet file per run; set HISTORY_DIR= to
+# turn it off). One row per numeric result: run_id, recorded_at, script,
+# git_commit, git_dirty, seed, scale, config (the results' non-engine keys as
+# JSON) + config_hash, engine, engine_version, metric (dotted path under the
+# engine), value, and histogram (serialized, on "<path>.histogram" rows).
+#
+#   python scripts/history.py record results/query_results.json   # backfill
+#   python scripts/history.py list
+#   python scripts/history.py compare --baseline v23.1.11 [--candidate <ref>]
+#
+# A ref is a run_id, a git commit prefix or an engine version; the candidate
+# defaults to each script's latest run. Results compare within the same
+# script, engine, metric, scale and config. A change is flagged when it is
+# both significant (p < --alpha) and larger than --min-change:
+#   latency with histograms  Mann-Whitney U over the two latency distributions
+#   other metrics            permutation test over runs (needs >= 2 per side;
+#                            otherwise reported untested, never flagged)
+# Ops within a run are not independent, so p-values on histograms run small;
+# --min-change is what keeps noise out. Exit status 1 if anything regressed.
+# ------------------------------------------
+
+import os, sys, json, math, uuid, hashlib, argparse, itertools, subprocess
+from datetime import datetime
+from pathlib import Path
+import numpy as np
+from histogram import LatencyHistogram, merged
+
+HISTORY_DIR = os.environ.get("HISTORY_DIR", "results/history")
+RUN_KEYS = ("seed", "scale")  # top-level results keys stored as their own columns
+COLUMNS = ("run_id", "recorded_at", "script", "git_commit", "git_dirty", "seed", "scale", "config", "config_hash",
+           "engine", "engine_version", "metric", "value", "histogram")
+# Metric direction by name; anything else is reported as "changed"
+HIGHER_IS_BETTER = ("qps", "per_s", "tps", "hit_ratio", "speedup")
+LOWER_IS_BETTER = ("_ms", "_s", "abort_rate", "retries_per_commit", "stale_ratio", "per_op", "db_reads_per_read")
+
+
+def _pyarrow():
+    try:
+        import pyarrow, pyarrow.parquet
+    except ImportError:
+        return None
+    return pyarrow
+
+
+def _git(*args):
+    try:
+        return subprocess.run(["git", *args], capture_output=True, text=True, check=True).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        return None
+
+
+def _engine_of(key):
+    # Results are keyed by engine name, sometimes with a suffix ("cockroachdb_batched")
+    from engines import ENGINES
+    return next((n for n in ENGINES if key == n or key.startswith(n + "_")), None)
+
+
+def _leaves(node, path=()):
+    for k, v in node.items():
+        if k == "histogram" and isinstance(v, dict) and "buckets" in v:
+            yield path + (k,), float(v["count"]), json.dumps(v)
+        elif isinstance(v, dict):
+            yield from _leaves(v, path + (str(k),))
+        elif isinstance(v, (int, float)):
+            yield path + (str(k),), float(v), None
+
+
+def flatten(results, script):
+    # History rows for one results dict (everything but run identity)
+    engines = {k: _engine_of(k) for k, v in results.items() if isinstance(v, dict) and _engine_of(k)}
+    config = {k: v for k, v in results.items() if k not in engines and k not in RUN_KEYS}
+    config_json = json.dumps(config, sort_keys=True, default=str)
+    base = {
+        "script": script,
+        "seed": results.get("seed"),
+        "scale": float(results["scale"]) if "scale" in results else None,
+        "config": config_json,
+        "config_hash": hashlib.sha1(config_json.encode()).hexdigest()[:12],
+    }
+    return [{**base, "engine": key, "metric": ".".join(path), "value": value, "histogram": hist}
+            for key in engines for path, value, hist in _leaves(results[key])], sorted(set(engines.values()))
+
+
+def record_run(path, history_dir=None):
+    # Append one saved results file to the history; never fails the benchmark
+    history_dir = HISTORY_DIR if history_dir is None else history_dir
+    if not history_dir:
+        return None
+    pa = _pyarrow()
+    if pa is None:
+        print("ℹ️  pyarrow not installed; run not added to the history")
+        return None
+    from engines import engine_versions
+    with open(path) as f:
+        results = json.load(f)
+    script = Path(path).stem
+    rows, names = flatten(results, script)
+    versions = engine_versions(names)
+    run_id = f"{datetime.utcnow():%Y%m%dT%H%M%S}-{uuid.uuid4().hex[:6]}"
+    run = {
+        "run_id": run_id,
+        "recorded_at": datetime.utcnow(),
+        "git_commit": _git("rev-parse", "HEAD"),
+        "git_dirty": bool(_git("status", "--porcelain", "--untracked-files=no")),
+    }
+    for r in rows:
+        r.update(run, engine_version=versions.get(_engine_of(r["engine"])))
+    os.makedirs(history_dir, exist_ok=True)
+    table = pa.Table.from_pylist(rows, schema=_schema(pa))
+    pa.parquet.write_table(table, os.path.join(history_dir, f"{script}-{run_id}.parquet"))
+    print(f"🗂  Recorded run {run_id} ({len(rows)} metrics) in {history_dir}")
+    return run_id
+
+
+def _schema(pa):
+    types = {"recorded_at": pa.timestamp("us"), "git_dirty": pa.bool_(), "seed": pa.int64(),
+             "scale": pa.float64(), "value": pa.float64()}
+    return pa.schema([(c, types.get(c, pa.string())) for c in COLUMNS])
+
+
+def load(history_dir=None):
+    pa = _pyarrow()
+    if pa is None:
+        raise SystemExit("The run history needs pyarrow (pip install pyarrow)")
+    history_dir = history_dir or HISTORY_DIR or "results/history"
+    if not Path(history_dir).is_dir() or not any(Path(history_dir).glob("*.parquet")):
+        raise SystemExit(f"No runs recorded in {history_dir}")
+    return pa.parquet.read_table(history_dir, schema=_schema(pa)).to_pylist()
+
+
+# ---------------------------- Statistics ----------------------------
+def mann_whitney(a, b):
+    # Two-sided p-value of Mann-Whitney U on two histograms (normal
+    # approximation, tie-corrected; each bucket is one tied value)
+    ca, cb = np.asarray(a.counts, dtype=float), np.asarray(b.counts, dtype=float)
+    n_a, n_b = ca.sum(), cb.sum()
+    if n_a == 0 or n_b == 0:
+        return None
+    t = ca + cb
+    midrank = np.cumsum(t) - (t - 1) / 2.0
+    u = (ca * midrank).sum() - n_a * (n_a + 1) / 2.0
+    n = n_a + n_b
+    var = n_a * n_b / 12.0 * ((n + 1) - (t ** 3 - t).sum() / (n * (n - 1)))
+    if var <= 0:
+        return 1.0
+    z = (u - n_a * n_b / 2.0) / math.sqrt(var)
+    return math.erfc(abs(z) / math.sqrt(2))
+
+
+def permutation_test(a, b, rounds=20_000, seed=0):
+    # Two-sided p-value for a difference in means between two small samples:
+    # exact over all splits when there are few, else `rounds` random ones
+    pooled, n_a = np.asarray(a + b, dtype=float), len(a)
+    observed = abs(np.mean(a) - np.mean(b))
+    idx = np.arange(len(pooled))
+    if math.comb(len(pooled), n_a) <= rounds:
+        splits = (list(c) for c in itertools.combinations(idx, n_a))
+    else:
+        rng = np.random.default_rng(seed)
+        splits = (rng.permutation(idx)[:n_a] for _ in range(rounds))
+    hits = total = 0
+    for s in splits:
+        mask = np.zeros(len(pooled), dtype=bool)
+        mask[s] = True
+        hits += abs(pooled[mask].mean() - pooled[~mask].mean()) >= observed - 1e-12
+        total += 1
+    return hits / total
+
+
+def direction(metric):
+    leaf = metric.rsplit(".", 1)[-1]
+    if any(k in leaf for k in HIGHER_IS_BETTER):
+        return 1
+    if any(leaf.endswith(k) for k in LOWER_IS_BETTER):
+        return -1
+    return 0
+
+
+# ---------------------------- Compare ----------------------------
+def select(rows, ref):
+    return [r for r in rows if ref in (r["run_id"], r["engine_version"]) or (r["git_commit"] or "").startswith(ref)]
+
+
+def latest_runs(rows):
+    latest = {}
+    for r in rows:
+        if r["script"] not in latest or r["recorded_at"] > latest[r["script"]][0]:
+            latest[r["script"]] = (r["recorded_at"], r["run_id"])
+    keep = {run_id for _, run_id in latest.values()}
+    return [r for r in rows if r["run_id"] in keep]
+
+
+def _group(rows):
+    groups = {}
+    for r in rows:
+        groups.setdefault((r["script"], r["engine"], r["scale"], r["config_hash"], r["metric"]), []).append(r)
+    return groups
+
+
+def compare(baseline, candidate, alpha=0.01, min_change=0.05):
+    base, cand = _group(baseline), _group(candidate)
+    out = []
+    for key in sorted(set(base) & set(cand), key=str):
+        script, engine, scale, _, metric = key
+        if metric.endswith(".histogram"):
+            continue
+        b = [r["value"] for r in base[key]]
+        c = [r["value"] for r in cand[key]]
+        b_mean, c_mean = float(np.mean(b)), float(np.mean(c))
+        change = (c_mean - b_mean) / abs(b_mean) if b_mean else (0.0 if c_mean == b_mean else math.inf)
+        parent = metric.rpartition(".")[0]
+        hist_key = key[:4] + (f"{parent}.histogram" if parent else "histogram",)
+        if metric.endswith("_ms") and hist_key in base and hist_key in cand:
+            test = "mann_whitney"
+            p = mann_whitney(merged(LatencyHistogram.from_dict(json.loads(r["histogram"])) for r in base[hist_key]),
+                             merged(LatencyHistogram.from_dict(json.loads(r["histogram"])) for r in cand[hist_key]))
+        elif len(b) >= 2 and len(c) >= 2:
+            test, p = "permutation", permutation_test(b, c)
+        else:
+            test, p = None, None
+        sign = direction(metric)
+        if p is None:
+            status = "untested"
+        elif p >= alpha or abs(change) < min_change:
+            status = "ok"
+        elif sign == 0:
+            status = "changed"
+        else:
+            status = "improvement" if change * sign > 0 else "regression"
+        out.append({"script": script, "engine": engine, "scale": scale, "metric": metric, "baseline": b_mean,
+                    "candidate": c_mean, "change": change, "n_baseline": len(b), "n_candidate": len(c),
+                    "test": test, "p_value": p, "status": status})
+    return out
+
+
+def _runs(rows):
+    runs = {}
+    for r in rows:
+        run = runs.setdefault(r["run_id"], {k: r[k] for k in ("run_id", "recorded_at", "script", "git_commit",
+                                                               "git_dirty", "seed", "scale")})
+        run.setdefault("engines", {})[r["engine"]] = r["engine_version"]
+    return sorted(runs.values(), key=lambda run: run["recorded_at"])
+
+
+if __name__ == "__main__":
+    ap = argparse.ArgumentParser(description="Benchmark run history")
+    ap.add_argument("--history-dir", default=None)
+    sub = ap.add_subparsers(dest="cmd", required=True)
+    rec = sub.add_parser("record", help="append saved results files to the history")
+    rec.add_argument("paths", nargs="+")
+    sub.add_parser("list", help="list recorded runs")
+    cmp_ = sub.add_parser("compare", help="flag significant changes against a baseline")
+    cmp_.add_argument("--baseline", required=True, help="run_id, git commit prefix or engine version")
+    cmp_.add_argument("--candidate", default=None, help="same forms; default: each script's latest run")
+    cmp_.add_argument("--script", default=None, help="only this results file stem, e.g. query_results")
+    cmp_.add_argument("--alpha", type=float, default=0.01)
+    cmp_.add_argument("--min-change", type=float, default=0.05, help="smallest relative change worth flagging")
+    cmp_.add_argument("--all", action="store_true", help="print unchanged metrics too")
+    cmp_.add_argument("--out", default="results/history_compare.json")
+    args = ap.parse_args()
+
+    if args.cmd == "record":
+        for p in args.paths:
+            record_run(p, args.history_dir or HISTORY_DIR or "results/history")
+        sys.exit(0)
+
+    rows = load(args.history_dir)
+    if args.cmd == "list":
+        for run in _runs(rows):
+            dirty = "+dirty" if run["git_dirty"] else ""
+            versions = ", ".join(f"{k}={v}" for k, v in run["engines"].items())
+            print(f"{run['run_id']}  {run['script']:28s} {(run['git_commit'] or '?')[:10]}{dirty:7s} "
+                  f"seed={run['seed']} scale={run['scale']}  {versions}")
+        sys.exit(0)
+
+    if args.script:
+        rows = [r for r in rows if r["script"] == args.script]
+    baseline = select(rows, args.baseline)
+    candidate = select(rows, args.candidate) if args.candidate else latest_runs(rows)
+    if not baseline:
+        raise SystemExit(f"No recorded runs match baseline {args.baseline!r}")
+    overlap = {r["run_id"] for r in baseline} & {r["run_id"] for r in candidate}
+    if overlap:
+        candidate = [r for r in candidate if r["run_id"] not in overlap]
+        if not candidate:
+            raise SystemExit("The candidate runs are the baseline runs; pass --candidate")
+    report = compare(baseline, candidate, args.alpha, args.min_change)
+
+    order = {"regression": 0, "improvement": 1, "changed": 2, "untested": 3, "ok": 4}
+    for r in sorted(report, key=lambda r: (order[r["status"]], -abs(r["change"]))):
+        if r["status"] in ("ok", "untested") and not args.all:
+            continue
+        p = "   n/a" if r["p_value"] is None else f"{r['p_value']:.4f}"
+        print(f"{r['status']:11s} {r['script']:24s} {r['engine']:20s} {r['metric']:44s} "
+              f"{r['baseline']:12.4g} -> {r['candidate']:12.4g} ({r['change']:+7.1%}) p={p}")
+    counts = {s: sum(r["status"] == s for r in report) for s in order}
+    print(", ".join(f"{n} {s}" for s, n in counts.items()))
+
+    os.makedirs(os.path.dirname(args.out) or ".", exist_ok=True)
+    with open(args.out, "w") as f:
+        json.dump({"baseline": args.baseline, "candidate": args.candidate or "latest", "alpha": args.alpha,
+                   "min_change": args.min_change, "counts": counts, "metrics": report}, f, indent=2)
+    sys.exit(1 if counts["regression"] else 0)
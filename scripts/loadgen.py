@@ -0,0 +1,130 @@
+# --- Open-loop load driver (shared by the rate-controlled benchmarks) ---
+# Requests follow a fixed arrival schedule (constant or Poisson) instead of
+# "next query as soon as the previous returns". The schedule is split
+# round-robin across connections (wrk2-style); a connection that falls behind
+# fires late requests immediately, and latency is measured from the
+# *intended* send time, so queueing delay is counted rather than omitted.
+# Service time (from the actual send) is reported alongside for comparison.
+# ------------------------------------------
+
+import threading, multiprocessing as mp
+from time import perf_counter, sleep
+from concurrent.futures import ProcessPoolExecutor
+import numpy as np
+from histogram import LatencyHistogram, merged
+
+ARRIVALS = ("constant", "poisson")
+
+
+def arrival_schedule(rate, duration_s, arrival="constant", rng=None):
+    # Intended send offsets (seconds from start), generated up front.
+    n = int(rate * duration_s)
+    if arrival == "constant":
+        return np.arange(n) / rate
+    if arrival == "poisson":
+        rng = rng or np.random.default_rng()
+        return np.cumsum(rng.exponential(1.0 / rate, n))
+    raise ValueError(f"unknown arrival process {arrival!r}; choose from {ARRIVALS}")
+
+
+def run_open_loop(engine, op, schedule, connections=32, kinds=None, kind_names=()):
+    # op(conn, i) executes request i on a connection from engine.reopen().
+    # For mixed workloads, kinds[i] indexes kind_names (the operation type of
+    # request i) and latencies are also broken down per operation type.
+    conns = [engine.reopen() for _ in range(connections)]
+    latency = [LatencyHistogram() for _ in range(connections)]
+    service = [LatencyHistogram() for _ in range(connections)]
+    by_kind = [[LatencyHistogram() for _ in kind_names] for _ in range(connections)]
+    errors = [[0] * max(len(kind_names), 1) for _ in range(connections)]
+
+    def worker(w):
+        conn, lat, svc, kind_h, err = conns[w], latency[w], service[w], by_kind[w], errors[w]
+        for i in range(w, len(schedule), connections):
+            k = kinds[i] if kinds is not None else 0
+            due = t_start + schedule[i]
+            now = perf_counter()
+            if now < due:
+                sleep(due - now)
+            sent = perf_counter()
+            try:
+                op(conn, i)
+            except Exception:
+                conn.rollback()
+                err[k] += 1
+                continue
+            done = perf_counter()
+            ms = (done - due) * 1000.0
+            lat.record(ms)
+            svc.record((done - sent) * 1000.0)
+            if kind_h:
+                kind_h[k].record(ms)
+
+    threads = [threading.Thread(target=worker, args=(w,)) for w in range(connections)]
+    t_start = perf_counter() + 0.05  # connections are open; give threads time to start
+    for t in threads:
+        t.start()
+    for t in threads:
+        t.join()
+    elapsed = perf_counter() - t_start
+    for c in conns:
+        c.close()
+
+    lat_hist, svc_hist = merged(latency), merged(service)
+    stats = lat_hist.summary()
+    stats["service"] = svc_hist.summary()
+    stats["errors"] = sum(sum(e) for e in errors)
+    stats["elapsed_s"] = elapsed
+    stats["achieved_qps"] = stats["n_ops"] / elapsed
+    if kind_names:
+        stats["by_op"] = {}
+        for k, name in enumerate(kind_names):
+            h = merged(kh[k] for kh in by_kind)
+            stats["by_op"][name] = {**h.summary(), "errors": sum(e[k] for e in errors), "histogram": h.to_dict()}
+    stats["histogram"] = lat_hist.to_dict()
+    return stats
+
+
+def find_max_rate(run_step, rates, slo_p99_ms, min_ratio=0.95):
+    # Steps the target rate up until p99 breaks the SLO or the driver can no
+    # longer keep up with the schedule; returns (steps, max sustainable QPS).
+    steps, best = [], None
+    for rate in rates:
+        stats = run_step(rate)
+        stats["target_qps"] = rate
+        stats["slo_ok"] = (
+            stats["n_ops"] > 0
+            and stats["p99_ms"] <= slo_p99_ms
+            and stats["achieved_qps"] >= min_ratio * rate
+            and stats["errors"] == 0
+        )
+        steps.append(stats)
+        if not stats["slo_ok"]:
+            break
+        best = rate
+    return steps, best
+
+
+# --- Multi-process fan-out ---
+class _NoBarrier:
+    def wait(self):
+        pass
+
+
+def run_processes(fn, n_processes, *args):
+    # Runs fn(proc_idx, barrier, *args) in n_processes driver processes that
+    # start their timed section together via barrier.wait(); returns the
+    # per-process results in proc_idx order. fn must be a module-level
+    # function (picklable), and scripts using this need a __main__ guard.
+    if n_processes == 1:
+        return [fn(0, _NoBarrier(), *args)]
+    with mp.Manager() as manager:
+        barrier = manager.Barrier(n_processes)
+        with ProcessPoolExecutor(max_workers=n_processes) as ex:
+            futures = [ex.submit(fn, p, barrier, *args) for p in range(n_processes)]
+            return [f.result() for f in futures]
+
+
+def split_evenly(total, parts):
+    # [(offset, count)] covering range(total) in `parts` near-equal slices
+    bounds = np.linspace(0, total, parts + 1).astype(int).tolist()
+    return [(lo, hi - lo) for lo, hi in zip(bounds[:-1], bounds[1:])]
@@ -0,0 +1,141 @@
+# --- Measurement core: warmup, repeated trials, bootstrap intervals ---
+# Shared by the scripts that time single operations:
+#
+#   trials = Trials.from_args(add_trial_args(ap).parse_args())
+#   stats = trials.ops(lambda uid: e.latest_n(uid, 20), uids)    # per-op, ms
+#   stats, outputs = trials.once(lambda users: e.insert_users(users), setup)   # whole op, s
+#
+# ops(): `warmup` untimed calls first (cycling through items: connections,
+# plan caches, buffer pools), then `trials` passes over every item, each op
+# timed into a per-trial histogram. Reports the merged histogram summary plus
+# bootstrap intervals for p50 and mean that resample whole trials (ops within
+# a trial are not independent; with one trial, ops are resampled), per-trial
+# p50/mean, and Tukey outliers (beyond 1.5 IQR) among ops and among trials.
+# once(): the op runs once per trial on setup(k)'s untimed output, after one
+# untimed warmup run (setup(-1)) unless warmup is 0; reports the median
+# seconds with a bootstrap interval and the per-trial times.
+# ------------------------------------------
+
+import os, argparse, itertools
+from time import perf_counter
+import numpy as np
+from histogram import LatencyHistogram, merged
+
+TRIALS = 5
+WARMUP = 20             # untimed calls before timing (ops); once(): one untimed run if > 0
+CONFIDENCE = 0.95
+RESAMPLES = 2000
+BOOTSTRAP_SEED = 0x5EED  # fixed so intervals are reproducible
+
+
+def add_trial_args(parser: argparse.ArgumentParser) -> argparse.ArgumentParser:
+    parser.add_argument("--trials", type=int, default=int(os.environ.get("TRIALS", TRIALS)),
+                        help="independent repetitions of each measurement (default: $TRIALS or %(default)s)")
+    parser.add_argument("--warmup", type=int, default=int(os.environ.get("WARMUP", WARMUP)),
+                        help="untimed warmup calls before each measurement (default: $WARMUP or %(default)s)")
+    parser.add_argument("--confidence", type=float, default=CONFIDENCE, help="bootstrap interval level")
+    return parser
+
+
+def tukey_fences(q1, q3, k=1.5):
+    return q1 - k * (q3 - q1), q3 + k * (q3 - q1)
+
+
+def _percentile(counts, values, p):
+    # counts: (..., n_buckets) against ascending bucket values
+    cum = np.cumsum(counts, axis=-1)
+    rank = np.maximum(np.ceil(p / 100.0 * cum[..., -1:]), 1)
+    return values[np.minimum((cum < rank).sum(axis=-1), len(values) - 1)]
+
+
+class Trials:
+    def __init__(self, trials=TRIALS, warmup=WARMUP, confidence=CONFIDENCE, resamples=RESAMPLES, seed=BOOTSTRAP_SEED):
+        if trials < 1:
+            raise ValueError("trials must be >= 1")
+        self.trials, self.warmup, self.confidence = trials, warmup, confidence
+        self.resamples, self.seed = resamples, seed
+
+    @classmethod
+    def from_args(cls, args):
+        return cls(args.trials, args.warmup, args.confidence)
+
+    def to_dict(self):
+        return {"trials": self.trials, "warmup": self.warmup, "confidence": self.confidence,
+                "resamples": self.resamples, "interval": "bootstrap percentile"}
+
+    def _interval(self, samples):
+        tail = (1.0 - self.confidence) / 2.0
+        return [float(np.quantile(samples, tail)), float(np.quantile(samples, 1.0 - tail))]
+
+    # ---------- Per-op latency ----------
+    def ops(self, op, items):
+        items = list(items)
+        for item in itertools.islice(itertools.cycle(items), self.warmup if items else 0):
+            op(item)
+        hists = []
+        for _ in range(self.trials):
+            h = LatencyHistogram()
+            for item in items:
+                t0 = perf_counter()
+                op(item)
+                h.record((perf_counter() - t0) * 1000.0)
+            hists.append(h)
+        return self.summarize(hists)
+
+    def summarize(self, hists):
+        # Stats for one measurement from its per-trial histograms
+        hist = merged(hists)
+        if hist.count == 0:
+            return {"n_ops": 0, "n_trials": len(hists)}
+        nz, values = hist.buckets()
+        counts = np.array([[h.counts[i] for i in nz] for h in hists], dtype=float)   # trials x buckets
+        sums = np.array([h.sum_us for h in hists], dtype=float) / 1000.0
+
+        rng = np.random.default_rng(self.seed)
+        if len(hists) > 1:
+            w = rng.multinomial(len(hists), [1.0 / len(hists)] * len(hists), size=self.resamples)
+            boot, boot_sum = w @ counts, w @ sums
+        else:
+            boot = rng.multinomial(hist.count, counts[0] / hist.count, size=self.resamples).astype(float)
+            boot_sum = boot @ values
+        boot_p50 = _percentile(boot, values, 50)
+        boot_avg = boot_sum / boot.sum(axis=1)
+
+        low, high = tukey_fences(hist.percentile(25), hist.percentile(75))
+        trial_p50 = [h.percentile(50) for h in hists]
+        t_low, t_high = tukey_fences(*np.percentile(trial_p50, [25, 75]))
+        return {
+            **hist.summary(),
+            "p50_ci_ms": self._interval(boot_p50),
+            "avg_ci_ms": self._interval(boot_avg),
+            "trial_p50_ms": trial_p50,
+            "trial_avg_ms": [h.mean() for h in hists],
+            "outliers": int(counts.sum(axis=0)[(values < low) | (values > high)].sum()),
+            "outlier_trials": int(sum(v < t_low or v > t_high for v in trial_p50)) if len(hists) >= 4 else 0,
+            "n_trials": len(hists),
+            "warmup": self.warmup,
+            "histogram": hist.to_dict(),
+        }
+
+    # ---------- Whole operations ----------
+    def once(self, op, setup=lambda k: k):
+        # ({stats}, [op's return value per trial])
+        if self.warmup > 0:
+            op(setup(-1))
+        times, outputs = [], []
+        for k in range(self.trials):
+            arg = setup(k)
+            t0 = perf_counter()
+            outputs.append(op(arg))
+            times.append(perf_counter() - t0)
+        rng = np.random.default_rng(self.seed)
+        boot = np.median(rng.choice(times, size=(self.resamples, len(times))), axis=1)
+        low, high = tukey_fences(*np.percentile(times, [25, 75]))
+        return {
+            "median_s": float(np.median(times)),
+            "ci_s": self._interval(boot),
+            "trial_s": times,
+            "outlier_trials": int(sum(t < low or t > high for t in times)) if len(times) >= 4 else 0,
+            "n_trials": len(times),
+            "warmup": int(self.warmup > 0),
+        }, outputs
@@ -0,0 +1,103 @@
+# --- Reproducible seeding (common block) ---
+import os, random
+import numpy as np
+from faker import Faker  # not used here, but kept for consistency
+
+SEED = int(os.environ.get("SEED", "42"))
+random.seed(SEED)
+np.random.seed(SEED)
+fake = Faker(); fake.seed_instance(SEED)
+print(f"SEED={SEED}")
+# ------------------------------------------
+
+# Dashboard-style analytics over posts/comments, run server-side (aggregation
+# pipeline on Mongo, GROUP BY in SQL):
+#   posts_per_user_day      posts per user per day, last 7 days
+#   top_commented_24h       10 most-commented posts, last 24 hours
+#   active_users_per_hour   distinct users posting or commenting per hour, last 2 days
+# "cold" is the first run on a fresh connection (caches on the server are not
+# flushed; restart the containers for truly cold numbers); "warm" summarizes
+# --reps repeats after it. Every engine must return the same answer, compared
+# in engine-neutral form (user ids mapped back to the generator's user index).
+
+import json, argparse
+from time import perf_counter
+from datetime import timedelta
+from engines import open_engines
+from datagen import Dataset, add_scale_arg, bind_comments, bind_users
+from histogram import LatencyHistogram
+from history import record_run
+
+ap = add_scale_arg(argparse.ArgumentParser())
+ap.add_argument("--reps", type=int, default=20, help="warm repeats per query")
+args = ap.parse_args()
+
+N_USERS = int(1000 * args.scale)
+N_POSTS = int(10_000 * args.scale)
+N_COMMENTS = int(30_000 * args.scale)
+BATCH = 1000
+
+ds = Dataset(N_USERS, N_POSTS, seed=SEED, prefix="ua")
+QUERIES = {
+    "posts_per_user_day": lambda e: e.posts_per_user_day(ds.anchor - timedelta(days=7)),
+    "top_commented_24h": lambda e: e.top_commented(ds.anchor - timedelta(days=1), 10),
+    "active_users_per_hour": lambda e: e.active_users_per_hour(ds.anchor - timedelta(days=2)),
+}
+
+def normalize(query, rows, uid_idx):
+    # Buckets come back as datetimes (CockroachDB) or strings (SQLite, Mongo)
+    if query == "posts_per_user_day":
+        return sorted((uid_idx[u], str(day)[:10], n) for u, day, n in rows)
+    if query == "top_commented_24h":
+        return [n for _, n in rows]  # post ids differ per engine; ties make the ids ambiguous anyway
+    return sorted((str(hour)[:13], n) for hour, n in rows)
+
+engines = open_engines(users="users_a", posts="posts_a", comments="comments_a")
+results = {e.name: {} for e in engines}
+answers = {}
+for e in engines:
+    # ---------- Fixture ----------
+    e.create_tables(email=False, post_index="user_created", comments=True)
+    user_ids = [i for batch in ds.users(BATCH, email=False) for i in e.insert_users(batch)]
+    for batch in bind_users(ds.posts(BATCH), user_ids):
+        e.insert_posts(batch)
+    post_ids = e.sample_ids("posts", N_POSTS)
+    for batch in bind_comments(ds.comments(N_COMMENTS, BATCH), user_ids, post_ids):
+        e.insert_comments(batch)
+    uid_idx = {u: i for i, u in enumerate(user_ids)}
+
+    # ---------- Cold (fresh connection) then warm ----------
+    for q, run in QUERIES.items():
+        conn = e.reopen()
+        t0 = perf_counter()
+        rows = run(conn)
+        cold_ms = (perf_counter() - t0) * 1000.0
+        warm = LatencyHistogram()
+        for _ in range(args.reps):
+            t0 = perf_counter()
+            run(conn)
+            warm.record((perf_counter() - t0) * 1000.0)
+        conn.close()
+        answers.setdefault(q, {})[e.name] = normalize(q, rows, uid_idx)
+        results[e.name][q] = {"cold_ms": cold_ms, "warm": warm.summary(), "rows": len(rows)}
+        print(f"{e.name:12s} {q:22s} cold={cold_ms:8.2f} ms warm p50={warm.percentile(50):8.2f} ms rows={len(rows)}")
+
+# ---------- Equivalence across engines ----------
+results["equivalent"] = {q: all(a == next(iter(by_engine.values())) for a in by_engine.values())
+                         for q, by_engine in answers.items()}
+print("equivalent:", results["equivalent"])
+
+# ---------- Save & cleanup ----------
+os.makedirs("results", exist_ok=True)
+results["seed"] = SEED
+results["consistency"] = {e.name: e.consistency_settings() for e in engines}
+results["scale"] = args.scale
+results["config"] = {"reps": args.reps, "comments": N_COMMENTS}
+with open("results/aggregation_results.json", "w") as f:
+    json.dump(results, f, indent=2)
+record_run("results/aggregation_results.json")
+
+for e in engines:
+    e.close()
+
+print("✅ Saved results to results/aggregation_results.json")
@@ -0,0 +1,235 @@
+# --- Reproducible seeding (common block) ---
+import os, random
+import numpy as np
+from faker import Faker  # not used here, but kept for consistency
+
+SEED = int(os.environ.get("SEED", "42"))
+random.seed(SEED)
+np.random.seed(SEED)
+fake = Faker(); fake.seed_instance(SEED)
+print(f"SEED={SEED}")
+# ------------------------------------------
+
+# Read-through cache in front of each engine (scripts/cache.py). Reader
+# threads run point lookups and latest-20 reads (keys from --distribution;
+# skew is what makes a cache pay) while writer threads rewrite post contents
+# at --write-rate. Cache modes:
+#   none      every read hits the database (baseline)
+#   lru       in-process LRU + TTL, invalidated on update_post
+#   lru-ttl   same, but entries only expire (no invalidation)
+#   resp      Redis-protocol cache over loopback TCP, invalidated; a local
+#             RespServer stand-in unless REDIS_URL points at a real Redis
+# Connections run in autocommit so uncached reads see each write once committed.
+# Database calls that fail transiently (lock conflicts, CockroachDB 40001) are
+# retried with jittered backoff and counted; a retried read's latency includes
+# its retries.
+# Reports hit ratio, latency split by hit/miss, the database reads left per
+# application read, and stale reads: a latest-20 result holding an older
+# version of a post than one committed before the read started, with how
+# old that version was.
+
+import json, argparse, threading, uuid
+from time import perf_counter, sleep
+from concurrent.futures import ThreadPoolExecutor
+from engines import open_engines, open_engine
+from datagen import Dataset, add_scale_arg, bind_users
+from distributions import KeyDistribution, add_distribution_args
+from histogram import LatencyHistogram, merged
+from cache import LRUCache, ReadThroughCache, RespCache, RespServer
+from history import record_run
+
+ap = add_distribution_args(add_scale_arg(argparse.ArgumentParser()))
+ap.add_argument("--caches", default="none,lru,lru-ttl,resp")
+ap.add_argument("--readers", type=int, default=8)
+ap.add_argument("--writers", type=int, default=2)
+ap.add_argument("--reads", type=int, default=2000, help="reads per reader thread")
+ap.add_argument("--write-rate", type=float, default=100.0, help="post updates per second, all writers together")
+ap.add_argument("--point-share", type=float, default=0.5, help="share of reads that are point lookups (rest latest-20)")
+ap.add_argument("--ttl-s", type=float, default=5.0)
+ap.add_argument("--max-items", type=int, default=10_000)
+ap.add_argument("--max-retries", type=int, default=10)
+args = ap.parse_args()
+CACHES = args.caches.split(",")
+DIST = KeyDistribution.from_args(args)
+
+N_USERS = int(1000 * args.scale)
+N_POSTS = int(10_000 * args.scale)
+BATCH = 1000
+TABLES = {"users": "users_ch", "posts": "posts_ch"}
+
+ds = Dataset(N_USERS, N_POSTS, seed=SEED, prefix="uch")
+usernames = [u["username"] for batch in ds.users(BATCH, email=False) for u in batch]
+
+
+def row_id(row):
+    return row["_id"] if isinstance(row, dict) else row[0]
+
+
+def row_version(row):
+    content = row["content"] if isinstance(row, dict) else row[2]
+    return int(content[2:].split(" ", 1)[0]) if content.startswith("#v") else 0
+
+
+def with_retries(conn, call, *a):
+    # (result, retries) for one call, retried as in run_ingest_sweep.writer
+    for attempt in range(args.max_retries + 1):
+        try:
+            return call(*a), attempt
+        except Exception as exc:
+            if attempt == args.max_retries or not conn.is_retryable(exc):
+                raise
+            conn.rollback()
+            sleep(random.uniform(0, min(1.0, 0.002 * 2 ** attempt)))  # jittered exponential backoff
+
+
+def make_tier(mode, server):
+    if mode == "none":
+        return None
+    if mode == "resp":
+        backend = RespCache(os.environ.get("REDIS_URL") or server.url, prefix=f"bench:{uuid.uuid4().hex[:8]}")
+    else:
+        backend = LRUCache(args.max_items)
+    return ReadThroughCache(backend, ttl_s=args.ttl_s, invalidate=mode != "lru-ttl")
+
+
+def reader(engine_name, tier, user_ids, history, reader_idx, barrier):
+    conn = open_engine(engine_name, autocommit=True, **TABLES)
+    if tier is not None:
+        conn = tier.wrap(conn)
+    rng = np.random.default_rng([SEED, 2, reader_idx])
+    keys = DIST.sample(N_USERS, args.reads, rng).tolist()
+    is_point = (rng.random(args.reads) < args.point_share).tolist()
+    hists = {(op, hit): LatencyHistogram() for op in ("point_lookup", "latest20") for hit in (True, False)}
+    stale, stale_age, retries = 0, LatencyHistogram(), 0
+    barrier.wait()
+    for k, point in zip(keys, is_point):
+        t0 = perf_counter()
+        if point:
+            _, n = with_retries(conn, conn.point_lookup, usernames[k])
+        else:
+            rows, n = with_retries(conn, conn.latest_n, user_ids[k], 20)
+        t1 = perf_counter()
+        retries += n
+        hit = tier is not None and conn.last_hit()
+        hists["point_lookup" if point else "latest20", hit].record((t1 - t0) * 1000.0)
+        if point:
+            continue
+        # Stale: a newer version of some post had committed before this read began
+        for row in rows:
+            versions = history.get(row_id(row))
+            if not versions:
+                continue
+            seen = row_version(row)
+            newer = [t for v, t in versions if v > seen and t < t0]
+            if newer:
+                stale += 1
+                stale_age.record((t0 - min(newer)) * 1000.0)
+                break
+    conn.close()
+    return hists, stale, stale_age, retries
+
+
+def writer(engine_name, tier, targets, history, done, barrier, rate):
+    # Each writer owns its posts, so a post's versions commit in order
+    conn = open_engine(engine_name, autocommit=True, **TABLES)
+    if tier is not None:
+        conn = tier.wrap(conn)
+    versions, n, retries = {}, 0, 0
+    barrier.wait()
+    start = perf_counter()
+    while not done.is_set():
+        pid = targets[n % len(targets)]
+        versions[pid] = versions.get(pid, 0) + 1
+        retries += with_retries(conn, conn.update_post, pid, f"#v{versions[pid]} edited")[1]
+        history.setdefault(pid, []).append((versions[pid], perf_counter()))
+        n += 1
+        sleep(max(0.0, start + n / rate - perf_counter()))
+    conn.close()
+    return n, retries
+
+
+def run_mode(e, mode, server, user_ids, write_targets):
+    tier = make_tier(mode, server)
+    history, done = {}, threading.Event()
+    barrier = threading.Barrier(args.readers + args.writers)
+    shards = [write_targets[w::args.writers] for w in range(args.writers)]
+    with ThreadPoolExecutor(max_workers=args.readers + args.writers) as ex:
+        writers = [ex.submit(writer, e.name, tier, shards[w], history, done, barrier, args.write_rate / args.writers)
+                   for w in range(args.writers)]
+        t0 = perf_counter()
+        out = list(ex.map(lambda i: reader(e.name, tier, user_ids, history, i, barrier), range(args.readers)))
+        total_s = perf_counter() - t0
+        done.set()
+        written = [f.result() for f in writers]
+    writes = sum(w[0] for w in written)
+
+    r = {}
+    reads = hits = 0
+    for op in ("point_lookup", "latest20"):
+        hit_h = merged(o[0][op, True] for o in out)
+        miss_h = merged(o[0][op, False] for o in out)
+        reads += hit_h.count + miss_h.count
+        hits += hit_h.count
+        r[op] = {
+            **merged([hit_h, miss_h]).summary(),
+            "hit_ratio": hit_h.count / max(1, hit_h.count + miss_h.count),
+            "hit": hit_h.summary() if hit_h.count else None,
+            "miss": miss_h.summary() if miss_h.count else None,
+        }
+    stale = sum(o[1] for o in out)
+    r.update({
+        "hit_ratio": hits / reads,
+        "db_reads_per_read": (reads - hits) / reads,  # 1.0 = no capacity saved
+        "reads_per_s": reads / total_s,
+        "db_reads_per_s": (reads - hits) / total_s,
+        "writes": writes,
+        "read_retries": sum(o[3] for o in out),
+        "write_retries": sum(w[1] for w in written),
+        "stale_reads": stale,
+        "stale_ratio": stale / max(1, r["latest20"]["n_ops"]),  # of latest-20 reads
+        "stale_age": merged(o[2] for o in out).summary() if stale else None,
+    })
+    if tier is not None:
+        r["cache"] = tier.backend.stats()
+        tier.backend.close()
+    return r
+
+
+server = RespServer().start() if "resp" in CACHES and not os.environ.get("REDIS_URL") else None
+engines = open_engines(**TABLES)
+results = {e.name: {} for e in engines}
+for e in engines:
+    e.create_tables(email=False, post_index="user_created")
+    user_ids = [i for batch in ds.users(BATCH, email=False) for i in e.insert_users(batch)]
+    for batch in bind_users(ds.posts(BATCH), user_ids):
+        e.insert_posts(batch)
+    # Writers rewrite posts that readers see: the latest posts of the hottest users
+    hot = DIST.sample(N_USERS, 200, np.random.default_rng([SEED, 3])).tolist()
+    write_targets = list(dict.fromkeys(row_id(p) for k in dict.fromkeys(hot) for p in e.latest_n(user_ids[k], 5)))
+
+    for mode in CACHES:
+        r = results[e.name][mode] = run_mode(e, mode, server, user_ids, write_targets)
+        hit = r["latest20"]["hit"]
+        print(f"{e.name:12s} {mode:8s} hit={r['hit_ratio']:6.1%} db reads/read={r['db_reads_per_read']:.2f} "
+              f"{r['reads_per_s']:9,.0f} reads/s latest20 p50={r['latest20']['p50_ms']:.3f} ms "
+              f"(hit {hit['p50_ms'] if hit else float('nan'):.3f}) stale={r['stale_ratio']:.2%} "
+              f"retries={r['read_retries']}/{r['write_retries']}")
+
+# ---------- Save & cleanup ----------
+os.makedirs("results", exist_ok=True)
+results["seed"] = SEED
+results["consistency"] = {e.name: e.consistency_settings() for e in engines}
+results["scale"] = args.scale
+results["config"] = {"readers": args.readers, "writers": args.writers, "reads_per_reader": args.reads,
+                     "write_rate": args.write_rate, "point_share": args.point_share, "ttl_s": args.ttl_s,
+                     "max_items": args.max_items, "max_retries": args.max_retries, "distribution": DIST.to_dict()}
+with open("results/cache_results.json", "w") as f:
+    json.dump(results, f, indent=2)
+record_run("results/cache_results.json")
+
+for e in engines:
+    e.close()
+if server is not None:
+    server.stop()
+
+print("✅ Saved results to results/cache_results.json")
@@ -0,0 +1,91 @@
+# --- Reproducible seeding (common block) ---
+import os, random
+import numpy as np
+from faker import Faker  # not used here, but kept for consistency
+
+SEED = int(os.environ.get("SEED", "42"))
+random.seed(SEED)
+np.random.seed(SEED)
+fake = Faker(); fake.seed_instance(SEED)
+print(f"SEED={SEED}")
+# ------------------------------------------
+
+# asyncio twin of run_concurrency_tests.py: N concurrent tasks on one event
+# loop share a pooled async client (Motor / asyncpg) instead of one thread and
+# connection each. Output uses the same avg/p95/QPS fields so the two drivers
+# can be compared directly (read_tasks_N here vs read_threads_N there).
+
+import json, argparse, asyncio
+from time import perf_counter
+from engines import open_engines
+from engines_async import open_async_engine
+from histogram import LatencyHistogram
+from distributions import KeyDistribution, add_distribution_args
+from history import record_run
+
+ap = add_distribution_args(argparse.ArgumentParser())
+ap.add_argument("--tasks", default="10,50,500,2000", help="concurrent in-flight requests")
+ap.add_argument("--reps-per-task", type=int, default=100)
+ap.add_argument("--pool-size", type=int, default=100)
+args = ap.parse_args()
+TASKS = [int(x) for x in args.tasks.split(",")]
+REPS_PER_TASK = args.reps_per_task
+DIST = KeyDistribution.from_args(args)
+
+# --- Load targets (usernames) once, from EVERY engine, then intersect for fairness ---
+engines = open_engines()
+common = None
+consistency = {e.name: e.consistency_settings() for e in engines}
+for e in engines:
+    names = set(e.usernames())
+    common = names if common is None else common & names
+    e.close()
+usernames = sorted(common or ())[:1000]
+if not usernames:
+    raise SystemExit("No common usernames across the selected engines. Run setup/tests first.")
+
+async def run_batch(name, engine_idx, n_tasks):
+    engine = await open_async_engine(name, pool_size=args.pool_size)
+    hist = LatencyHistogram()
+
+    # Keys drawn before the clock starts; deterministic, distinct per engine and task
+    keys = [DIST.sample(len(usernames), REPS_PER_TASK, np.random.default_rng([SEED, engine_idx, i])).tolist()
+            for i in range(n_tasks)]
+
+    async def task(task_idx: int):
+        for k in keys[task_idx]:
+            uname = usernames[k]
+            t0 = perf_counter()
+            await engine.point_lookup(uname)
+            hist.record((perf_counter() - t0) * 1000.0)  # ms
+
+    t0 = perf_counter()
+    await asyncio.gather(*(task(i) for i in range(n_tasks)))
+    total_s = perf_counter() - t0
+    await engine.close()
+
+    return {
+        **hist.summary(),
+        "throughput_qps": hist.count / total_s,
+        "n_tasks": n_tasks,
+        "pool_size": args.pool_size,
+        "histogram": hist.to_dict(),
+    }
+
+results = {e.name: {} for e in engines}
+for n in TASKS:
+    for idx, e in enumerate(engines):
+        r = results[e.name][f"read_tasks_{n}"] = asyncio.run(run_batch(e.name, idx, n))
+        print(f"{e.name:12s} tasks={n:<5d} avg={r['avg_ms']:.2f} ms p95={r['p95_ms']:.2f} ms {r['throughput_qps']:,.0f} qps")
+
+# --- Save ---
+os.makedirs("results", exist_ok=True)
+results["seed"] = SEED
+results["consistency"] = consistency
+results["driver"] = "asyncio"
+results["distribution"] = DIST.to_dict()
+with open("results/concurrency_async_results.json", "w") as f:
+    json.dump(results, f, indent=2)
+record_run("results/concurrency_async_results.json")
+
+print("✅ Saved results to results/concurrency_async_results.json")
@@ -0,0 +1,113 @@
+# --- Reproducible seeding (common block) ---
+import os, random
+import numpy as np
+from faker import Faker  # not used here, but kept for consistency
+
+SEED = int(os.environ.get("SEED", "42"))
+random.seed(SEED)
+np.random.seed(SEED)
+fake = Faker(); fake.seed_instance(SEED)
+print(f"SEED={SEED}")
+# ------------------------------------------
+
+# Durability / consistency matrix: the same writes and reads under each
+# CONSISTENCY_PROFILES entry (engines.py), e.g. Mongo w=1 vs majority + j and
+# readConcern local/majority/snapshot, CockroachDB serializable vs read
+# committed and follower reads. Per profile and engine, on a fresh fixture:
+#   insert_one    single-post inserts, one commit / acknowledged write each
+#   insert_batch  100-post batches
+#   update_one    single-post content updates
+#   point_lookup, latest20   sampled reads
+# Each cell records the effective settings next to its numbers. Settings the
+# deployment cannot honour (snapshot or secondary reads on a standalone
+# mongod, read committed disabled on the cluster) are recorded as errors.
+
+import json, argparse
+from time import perf_counter, sleep
+from engines import CONSISTENCY_PROFILES, engine_names, open_engine
+from datagen import Dataset, add_scale_arg, bind_users
+from distributions import KeyDistribution, add_distribution_args
+from histogram import LatencyHistogram
+from history import record_run
+
+ap = add_distribution_args(add_scale_arg(argparse.ArgumentParser()))
+ap.add_argument("--profiles", default=",".join(CONSISTENCY_PROFILES), help="consistency profiles to run")
+ap.add_argument("--ops", type=int, default=500, help="operations per single-op workload")
+ap.add_argument("--batches", type=int, default=20, help="100-post batches for insert_batch")
+args = ap.parse_args()
+PROFILES = args.profiles.split(",")
+DIST = KeyDistribution.from_args(args)
+
+N_USERS = int(1000 * args.scale)
+N_POSTS = int(10_000 * args.scale)
+BATCH = 1000
+WRITE_BATCH = 100
+FOLLOWER_LAG_S = 5  # follower_read_timestamp() trails now() by ~4.8s
+TABLES = {"users": "users_c", "posts": "posts_c"}
+
+ds = Dataset(N_USERS, N_POSTS, seed=SEED, prefix="uc")
+usernames = [u["username"] for batch in ds.users(BATCH, email=False) for u in batch]
+keys = DIST.sample(N_USERS, args.ops, np.random.default_rng([SEED, 1])).tolist()
+# Extra posts for the write workloads, past the fixture's range
+extra = Dataset(N_USERS, N_POSTS + args.ops + args.batches * WRITE_BATCH, seed=SEED, prefix="uc")
+
+
+def timed(fn, items):
+    hist = LatencyHistogram()
+    t0 = perf_counter()
+    for item in items:
+        t1 = perf_counter()
+        fn(item)
+        hist.record((perf_counter() - t1) * 1000.0)
+    return {**hist.summary(), "ops_per_s": hist.count / (perf_counter() - t0)}
+
+
+def run_cell(e):
+    e.create_tables(email=False, post_index="user_created")
+    user_ids = [i for batch in ds.users(BATCH, email=False) for i in e.insert_users(batch)]
+    for batch in bind_users(ds.posts(BATCH), user_ids):
+        e.insert_posts(batch)
+    post_ids = e.sample_ids("posts", args.ops)
+
+    r = {"settings": e.consistency_settings()}
+    singles = [p for batch in bind_users(extra.posts(1, N_POSTS, N_POSTS + args.ops), user_ids) for p in batch]
+    r["insert_one"] = timed(lambda p: e.insert_posts([p]), singles)
+    batches = list(bind_users(extra.posts(WRITE_BATCH, N_POSTS + args.ops, extra.n_posts), user_ids))
+    r["insert_batch"] = timed(e.insert_posts, batches)
+    r["insert_batch"]["rows_per_s"] = r["insert_batch"]["ops_per_s"] * WRITE_BATCH
+    r["update_one"] = timed(lambda pid: e.update_post(pid, "edited"), post_ids)
+
+    if e.consistency_settings().get("follower_reads"):
+        sleep(FOLLOWER_LAG_S)  # reads at the follower timestamp must see the fixture
+    r["point_lookup"] = timed(lambda k: e.point_lookup(usernames[k]), keys)
+    r["latest20"] = timed(lambda k: e.latest_n(user_ids[k], 20), keys)
+    return r
+
+
+results = {}
+for profile in PROFILES:
+    for name in engine_names():
+        e = open_engine(name, consistency=profile, **TABLES)
+        try:
+            r = run_cell(e)
+        except Exception as exc:
+            e.rollback()
+            r = {"settings": {"profile": profile, **CONSISTENCY_PROFILES[profile].get(name, {})}, "error": repr(exc)}
+            print(f"{name:12s} {profile:10s} failed: {exc!r}")
+        else:
+            print(f"{name:12s} {profile:10s} insert_one p50={r['insert_one']['p50_ms']:.2f} ms "
+                  f"batch {r['insert_batch']['rows_per_s']:,.0f} rows/s update p50={r['update_one']['p50_ms']:.2f} ms "
+                  f"point p50={r['point_lookup']['p50_ms']:.3f} ms latest20 p50={r['latest20']['p50_ms']:.3f} ms")
+        results.setdefault(name, {})[profile] = r
+        e.close()
+
+# ---------- Save ----------
+os.makedirs("results", exist_ok=True)
+results["seed"] = SEED
+results["scale"] = args.scale
+results["config"] = {"ops": args.ops, "batches": args.batches, "write_batch": WRITE_BATCH, "distribution": DIST.to_dict()}
+with open("results/consistency_results.json", "w") as f:
+    json.dump(results, f, indent=2)
+record_run("results/consistency_results.json")
+
+print("✅ Saved results to results/consistency_results.json")
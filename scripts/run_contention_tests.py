@@ -0,0 +1,167 @@
+# --- Reproducible seeding (common block) ---
+import os, random
+import numpy as np
+from faker import Faker  # not used here, but kept for consistency
+
+SEED = int(os.environ.get("SEED", "42"))
+random.seed(SEED)
+np.random.seed(SEED)
+fake = Faker(); fake.seed_instance(SEED)
+print(f"SEED={SEED}")
+# ------------------------------------------
+
+# Transaction contention: concurrent workers run multi-statement
+# read-modify-write transactions against a tunable number of hot rows,
+#   like      read a post's like_count, insert the like, write count + 1
+#   transfer  read two users' credits, move 1..10 credits between them
+# retrying retryable aborts (CockroachDB 40001, Mongo TransientTransactionError,
+# SQLite lock upgrades) with jittered exponential backoff. Reports committed
+# TPS, the share of attempts that aborted, retries per commit and latency
+# from first attempt to commit (retries and backoff included). Every cell runs
+# on a fresh fixture and checks afterwards that no update was lost (credits
+# conserved, like_count total == likes rows).
+
+import json, argparse, threading
+from time import perf_counter, sleep, time
+from concurrent.futures import ThreadPoolExecutor
+from engines import open_engines, open_engine
+from datagen import Dataset, add_scale_arg, bind_users
+from histogram import LatencyHistogram, merged
+from history import record_run
+
+ap = add_scale_arg(argparse.ArgumentParser())
+ap.add_argument("--workloads", default="like,transfer")
+ap.add_argument("--workers", default="1,8,32", help="concurrent workers, one connection each")
+ap.add_argument("--hot-rows", default="1,10,100,1000", help="posts (like) / users (transfer) the workers pick from")
+ap.add_argument("--ops", type=int, default=100, help="committed-or-abandoned transactions per worker")
+ap.add_argument("--max-retries", type=int, default=20)
+args = ap.parse_args()
+WORKLOADS = args.workloads.split(",")
+WORKERS = [int(x) for x in args.workers.split(",")]
+HOT_ROWS = [int(x) for x in args.hot_rows.split(",")]
+
+N_USERS = int(2000 * args.scale)
+N_POSTS = max(int(1000 * args.scale), max(HOT_ROWS))
+INITIAL_CREDITS = 1000
+BATCH = 1000
+TABLES = {"users": "users_tx", "posts": "posts_tx", "follows": "follows_tx", "likes": "likes_tx", "inbox": "inbox_tx"}
+
+ds = Dataset(N_USERS, N_POSTS, seed=SEED, prefix="utx")
+
+
+def draw_ops(workload, hot, rng, user_ids, post_ids):
+    if workload == "like":
+        users = rng.integers(0, len(user_ids), args.ops)
+        posts = rng.integers(0, hot, args.ops)
+        return [(user_ids[u], post_ids[p]) for u, p in zip(users, posts)]
+    hot = max(hot, 2)
+    pairs = [rng.choice(hot, 2, replace=False) for _ in range(args.ops)]
+    amounts = rng.integers(1, 11, args.ops)
+    return [(user_ids[a], user_ids[b], int(x)) for (a, b), x in zip(pairs, amounts)]
+
+
+def worker(engine_name, workload, ops, barrier):
+    conn = open_engine(engine_name, **TABLES)
+    txn = conn.like_post if workload == "like" else conn.transfer_credits
+    hist = LatencyHistogram()
+    committed = declined = retries = gave_up = 0
+    attempts_per_commit = []
+    barrier.wait()
+    started = time()
+    for op in ops:
+        t0 = perf_counter()
+        for attempt in range(args.max_retries + 1):
+            try:
+                ok = txn(*op)
+            except Exception as exc:
+                if not conn.is_retryable(exc):
+                    raise
+                conn.rollback()
+                if attempt == args.max_retries:
+                    gave_up += 1
+                    break
+                retries += 1
+                sleep(random.uniform(0, min(0.5, 0.001 * 2 ** attempt)))  # jittered exponential backoff
+                continue
+            hist.record((perf_counter() - t0) * 1000.0)
+            committed += 1
+            declined += not ok  # duplicate like / insufficient credits: committed, nothing changed
+            attempts_per_commit.append(attempt + 1)
+            break
+    ended = time()
+    conn.close()
+    return {"hist": hist, "committed": committed, "declined": declined, "retries": retries,
+            "gave_up": gave_up, "attempts": attempts_per_commit, "started": started, "ended": ended}
+
+
+def run_cell(e, workload, hot, n_workers, cell_idx):
+    # Fresh fixture per cell so likes and balances start from the same state
+    e.create_tables(email=False, post_index=None, social=True, counters=True)
+    user_ids = [i for batch in ds.users(BATCH, email=False) for i in e.insert_users(batch)]
+    for batch in bind_users(ds.posts(BATCH), user_ids):
+        e.insert_posts(batch)
+    post_ids = e.sample_ids("posts", N_POSTS)
+    e.bulk_update("users", "credits", [(u, INITIAL_CREDITS) for u in user_ids])
+    before = e.counter_totals()
+
+    ops = [draw_ops(workload, hot, np.random.default_rng([SEED, cell_idx, w]), user_ids, post_ids) for w in range(n_workers)]
+    barrier = threading.Barrier(n_workers)
+    with ThreadPoolExecutor(max_workers=n_workers) as ex:
+        out = list(ex.map(lambda w: worker(e.name, workload, ops[w], barrier), range(n_workers)))
+
+    credits, like_count, likes = e.counter_totals()
+    hist = merged(o["hist"] for o in out)
+    committed = sum(o["committed"] for o in out)
+    retries = sum(o["retries"] for o in out)
+    gave_up = sum(o["gave_up"] for o in out)
+    attempts = np.array([a for o in out for a in o["attempts"]] or [0])
+    total_s = max(o["ended"] for o in out) - min(o["started"] for o in out)
+    aborted = retries + gave_up
+    return {
+        **hist.summary(),
+        "committed_tps": committed / total_s,
+        "committed": committed,
+        "declined": sum(o["declined"] for o in out),
+        "gave_up": gave_up,
+        "aborted_attempts": aborted,
+        "abort_rate": aborted / (committed + aborted),  # share of all attempts
+        "retries_per_commit": float(attempts.mean() - 1),
+        "max_attempts": int(attempts.max()),
+        "invariants_ok": credits == before[0] and like_count == likes,
+        "counter_totals": {"credits": credits, "like_count": like_count, "likes": likes},
+        "histogram": hist.to_dict(),
+    }
+
+
+engines = open_engines(**TABLES)
+results = {}
+for e in engines:
+    if not e.supports_transactions:
+        results[e.name] = {"supported": False}
+        print(f"{e.name:12s} no multi-statement transactions (Mongo needs a replica set); skipped")
+        continue
+    results[e.name] = {"supported": True}
+    cell_idx = 0
+    for workload in WORKLOADS:
+        for hot in HOT_ROWS:
+            for n_workers in WORKERS:
+                cell_idx += 1
+                r = results[e.name][f"{workload}_hot_{hot}_workers_{n_workers}"] = run_cell(e, workload, hot, n_workers, cell_idx)
+                print(f"{e.name:12s} {workload:8s} hot={hot:<5d} workers={n_workers:<3d} {r['committed_tps']:8,.0f} tps "
+                      f"abort={r['abort_rate']:6.1%} retries/commit={r['retries_per_commit']:.2f} "
+                      f"p99={r['p99_ms']:.2f} ms gave_up={r['gave_up']} ok={r['invariants_ok']}")
+
+# ---------- Save & cleanup ----------
+os.makedirs("results", exist_ok=True)
+results["seed"] = SEED
+results["consistency"] = {e.name: e.consistency_settings() for e in engines}
+results["scale"] = args.scale
+results["config"] = {"ops_per_worker": args.ops, "max_retries": args.max_retries, "initial_credits": INITIAL_CREDITS}
+with open("results/contention_results.json", "w") as f:
+    json.dump(results, f, indent=2)
+record_run("results/contention_results.json")
+
+for e in engines:
+    e.close()
+
+print("✅ Saved results to results/contention_results.json")
@@ -0,0 +1,121 @@
+# --- Reproducible seeding (common block) ---
+import os, random
+import numpy as np
+from faker import Faker  # not used here, but kept for consistency
+
+SEED = int(os.environ.get("SEED", "42"))
+random.seed(SEED)
+np.random.seed(SEED)
+fake = Faker(); fake.seed_instance(SEED)
+print(f"SEED={SEED}")
+# ------------------------------------------
+
+# Comment layouts for the post page ("a post with its latest 10 comments"):
+#   referenced  comments table / collection, read with one join or $lookup
+#   embedded    Mongo: latest EMBEDDED_COMMENTS inside the post plus bucket
+#               documents for the full history; SQL: one JSONB array column
+# Per engine and layout, on a fresh fixture, --posts posts grow one comment at
+# a time (single-comment writes, round robin) up to each --checkpoints count;
+# at every checkpoint the post page is read --reads times. Reports add-comment
+# latency per growth segment and post-page latency per comment count, and
+# checks both layouts return the same comments.
+
+import json, argparse
+from datetime import datetime, timedelta
+from time import perf_counter
+from engines import engine_names, open_engine
+from datagen import Dataset, add_scale_arg, bind_users
+from histogram import LatencyHistogram
+from history import record_run
+
+ap = add_scale_arg(argparse.ArgumentParser())
+ap.add_argument("--layouts", default="referenced,embedded")
+ap.add_argument("--posts", type=int, default=20, help="posts that receive comments")
+ap.add_argument("--checkpoints", default="10,100,1000", help="comments per post at which reads are measured")
+ap.add_argument("--reads", type=int, default=500, help="post-page reads per checkpoint")
+ap.add_argument("--page", type=int, default=10, help="comments shown with the post")
+args = ap.parse_args()
+LAYOUTS = args.layouts.split(",")
+CHECKPOINTS = [int(x) for x in args.checkpoints.split(",")]
+
+N_USERS = int(1000 * args.scale)
+N_POSTS = int(10_000 * args.scale)
+BATCH = 1000
+COMMENTED_AT = datetime(2025, 1, 1)  # comments arrive in order, 1 s apart per post
+TABLES = {"users": "users_em", "posts": "posts_em", "comments": "comments_em", "comment_buckets": "comment_buckets_em"}
+
+ds = Dataset(N_USERS, N_POSTS, seed=SEED, prefix="uem")
+# Commenter and text of every comment, shared by all engines and layouts
+comments = list(ds.iter_comments(args.posts * max(CHECKPOINTS)))
+read_keys = np.random.default_rng([SEED, 1]).integers(0, args.posts, args.reads).tolist()
+
+
+def comment_text(c):
+    return c["content"] if isinstance(c, dict) else c[2]
+
+
+def run_layout(e, layout):
+    # comments=True either way: an old comments table would pin posts on DROP
+    e.create_tables(email=False, post_index="user_created", comments=True, embedded_comments=layout == "embedded")
+    user_ids = [i for batch in ds.users(BATCH, email=False) for i in e.insert_users(batch)]
+    for batch in bind_users(ds.posts(BATCH), user_ids):
+        e.insert_posts(batch)
+    post_ids = e.sample_ids("posts", args.posts)
+    add = (lambda c: e.insert_comments([c])) if layout == "referenced" else (lambda c: e.embed_comments([c]))
+    read = e.post_with_comments if layout == "referenced" else e.post_with_embedded
+
+    r, done = {}, 0
+    for target in CHECKPOINTS:
+        writes = LatencyHistogram()
+        t0 = perf_counter()
+        for k in range(done * args.posts, target * args.posts):
+            c = comments[k]
+            comment = {"post_id": post_ids[k % args.posts], "user_id": user_ids[c["user_idx"]], "content": c["content"],
+                       "created_at": COMMENTED_AT + timedelta(seconds=k // args.posts)}
+            t1 = perf_counter()
+            add(comment)
+            writes.record((perf_counter() - t1) * 1000.0)
+        write_s = perf_counter() - t0
+        done = target
+
+        reads = LatencyHistogram()
+        for k in read_keys:
+            t1 = perf_counter()
+            read(post_ids[k], args.page)
+            reads.record((perf_counter() - t1) * 1000.0)
+        _, page = read(post_ids[0], args.page)
+        r[f"comments_{target}"] = {
+            "add_comment": {**writes.summary(), "ops_per_s": writes.count / write_s},
+            "post_page": reads.summary(),
+            "page_contents": [comment_text(c) for c in page],
+        }
+    return r
+
+
+results = {}
+for name in engine_names():
+    e = open_engine(name, **TABLES)
+    results[name] = {layout: run_layout(e, layout) for layout in LAYOUTS}
+    for target in CHECKPOINTS:
+        cells = [results[name][layout][f"comments_{target}"] for layout in LAYOUTS]
+        match = all(c["page_contents"] == cells[0]["page_contents"] for c in cells)
+        results[name][f"match_{target}"] = match
+        print(f"{e.name:12s} comments={target:<5d} " + " | ".join(
+            f"{layout}: add p50={c['add_comment']['p50_ms']:.3f} ms page p50={c['post_page']['p50_ms']:.3f} ms"
+            for layout, c in zip(LAYOUTS, cells)) + f" | match={match}")
+    for layout in LAYOUTS:
+        for cell in results[name][layout].values():
+            del cell["page_contents"]
+    results.setdefault("consistency", {})[name] = e.consistency_settings()
+    e.close()
+
+# ---------- Save ----------
+os.makedirs("results", exist_ok=True)
+results["seed"] = SEED
+results["scale"] = args.scale
+results["config"] = {"posts": args.posts, "checkpoints": CHECKPOINTS, "reads": args.reads, "page": args.page}
+with open("results/embedding_results.json", "w") as f:
+    json.dump(results, f, indent=2)
+record_run("results/embedding_results.json")
+
+print("✅ Saved results to results/embedding_results.json")
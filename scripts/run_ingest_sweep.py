@@ -0,0 +1,137 @@
+# --- Reproducible seeding (common block) ---
+import os, random
+import numpy as np
+from faker import Faker  # not used here, but kept for consistency
+
+SEED = int(os.environ.get("SEED", "42"))
+random.seed(SEED)
+np.random.seed(SEED)
+fake = Faker(); fake.seed_instance(SEED)
+print(f"SEED={SEED}")
+# ------------------------------------------
+
+# Parallel ingest grid: posts are sharded across N writers (threads or
+# processes, each with its own connection) for every writers x batch-size
+# cell. Writers regenerate their own shard from the seed-stable dataset and
+# materialize it before a shared barrier, so only the inserts are timed.
+
+import json, argparse, threading, multiprocessing as mp
+from time import perf_counter, time, sleep
+from concurrent.futures import ThreadPoolExecutor, ProcessPoolExecutor
+from engines import open_engines, open_engine
+from datagen import Dataset, add_scale_arg, bind_users
+from histogram import LatencyHistogram, merged
+from history import record_run
+
+ap = add_scale_arg(argparse.ArgumentParser())
+ap.add_argument("--writers", default="1,2,4,8,16")
+ap.add_argument("--batch-sizes", default="100,1000,10000")
+ap.add_argument("--executor", choices=("thread", "process"), default="thread")
+ap.add_argument("--max-retries", type=int, default=10)
+args = ap.parse_args()
+WRITERS = [int(x) for x in args.writers.split(",")]
+BATCH_SIZES = [int(x) for x in args.batch_sizes.split(",")]
+
+N_USERS = int(1000 * args.scale)
+N_POSTS = int(50_000 * args.scale)
+TABLES = {"users": "users_i", "posts": "posts_i"}
+
+
+def writer(engine_name, ds_kwargs, user_ids, start, stop, batch_size, barrier, max_retries):
+    # Runs in a worker thread or process; returns the per-batch latency histogram,
+    # retry count and wall-clock start/end for the cross-writer throughput.
+    engine = open_engine(engine_name, **TABLES)
+    ds = Dataset(**ds_kwargs)
+    batches = list(bind_users(ds.posts(batch_size, start, stop), user_ids))
+    hist, retries = LatencyHistogram(), 0
+    barrier.wait()
+    started = time()
+    for batch in batches:
+        for attempt in range(max_retries + 1):
+            t0 = perf_counter()
+            try:
+                engine.insert_posts(batch)
+            except Exception as exc:
+                if attempt == max_retries or not engine.is_retryable(exc):
+                    raise
+                engine.rollback()
+                retries += 1
+                sleep(random.uniform(0, min(1.0, 0.002 * 2 ** attempt)))  # jittered exponential backoff
+                continue
+            hist.record((perf_counter() - t0) * 1000.0)
+            break
+    ended = time()
+    engine.close()
+    return hist, retries, started, ended
+
+
+def run_cell(engine, ds, n_writers, batch_size):
+    engine.create_tables(email=True, post_index="user_created")
+    user_ids = [i for batch in ds.users(1000) for i in engine.insert_users(batch)]
+    ds_kwargs = {"n_users": ds.n_users, "n_posts": ds.n_posts, "seed": ds.seed, "prefix": ds.prefix, "anchor": ds.anchor}
+    bounds = np.linspace(0, N_POSTS, n_writers + 1).astype(int).tolist()
+
+    if args.executor == "process":
+        manager = mp.Manager()
+        barrier, pool = manager.Barrier(n_writers), ProcessPoolExecutor(max_workers=n_writers)
+    else:
+        manager = None
+        barrier, pool = threading.Barrier(n_writers), ThreadPoolExecutor(max_workers=n_writers)
+    with pool:
+        futures = [
+            pool.submit(writer, engine.name, ds_kwargs, user_ids, bounds[w], bounds[w + 1],
+                        batch_size, barrier, args.max_retries)
+            for w in range(n_writers)
+        ]
+        out = [f.result() for f in futures]
+    if manager is not None:
+        manager.shutdown()
+
+    hist = merged(o[0] for o in out)
+    stats = hist.summary()
+    wall_s = max(o[3] for o in out) - min(o[2] for o in out)
+    return {
+        "writers": n_writers,
+        "batch_size": batch_size,
+        "rows": N_POSTS,
+        "wall_s": wall_s,
+        "rows_per_s": N_POSTS / wall_s,
+        "batch_p50_ms": stats["p50_ms"],
+        "batch_p95_ms": stats["p95_ms"],
+        "batch_p99_ms": stats["p99_ms"],
+        "batch_p999_ms": stats["p999_ms"],
+        "batch_max_ms": stats["max_ms"],
+        "n_batches": stats["n_ops"],
+        "retries": sum(o[1] for o in out),
+        "histogram": hist.to_dict(),
+    }
+
+
+if __name__ == "__main__":
+    engines = open_engines(**TABLES)
+    ds = Dataset(N_USERS, N_POSTS, seed=SEED, prefix="ui")
+    results = {e.name: {} for e in engines}
+
+    for e in engines:
+        for w in WRITERS:
+            for b in BATCH_SIZES:
+                cell = run_cell(e, ds, w, b)
+                results[e.name][f"writers_{w}_batch_{b}"] = cell
+                print(f"{e.name:12s} writers={w:<3d} batch={b:<6d} {cell['rows_per_s']:12,.0f} rows/s  "
+                      f"p99={cell['batch_p99_ms']:.2f} ms  retries={cell['retries']}")
+
+    # --- Save & cleanup ---
+    os.makedirs("results", exist_ok=True)
+    results["seed"] = SEED
+    results["consistency"] = {e.name: e.consistency_settings() for e in engines}
+    results["key_strategy"] = {e.name: e.key_strategy for e in engines}
+    results["scale"] = args.scale
+    results["executor"] = args.executor
+    with open("results/ingest_sweep_results.json", "w") as f:
+        json.dump(results, f, indent=2)
+    record_run("results/ingest_sweep_results.json")
+
+    for e in engines:
+        e.close()
+
+    print("✅ Saved results to results/ingest_sweep_results.json")
@@ -0,0 +1,158 @@
+# --- Reproducible seeding (common block) ---
+import os, random
+import numpy as np
+from faker import Faker  # not used here, but kept for consistency
+
+SEED = int(os.environ.get("SEED", "42"))
+random.seed(SEED)
+np.random.seed(SEED)
+fake = Faker(); fake.seed_instance(SEED)
+print(f"SEED={SEED}")
+# ------------------------------------------
+
+# Primary-key strategies under concurrent inserts (KEY_STRATEGIES in
+# engines.py): sequential SERIAL / ObjectId, random UUIDs, and CockroachDB's
+# hash-sharded primary key and posts index. Per strategy and writer count, on
+# a fresh fixture, writer threads (one connection each) insert post batches
+# and get the new ids back. Reports rows/s, batch latency and two hotspot
+# measures taken from where the new ids sit in primary-key order afterwards:
+#   right_edge_share  share of new rows that sorted after every row committed
+#                     before them (1.0: all writes append to one range)
+#   hot_slice_share   the fixture's key space cut into HOT_SLICES equal
+#                     slices; per window of WINDOW_ROWS consecutive inserts,
+#                     the largest share landing in one slice, averaged
+#                     (1/HOT_SLICES is even, 1.0 a single hot range)
+# These are client-side views of key placement, not range statistics; on a
+# multi-node cluster read them next to the per-node write load. Batches that
+# hit a transient conflict (CockroachDB 40001, SQLite lock) are retried with
+# jittered backoff and counted per cell; batch latency includes the retries.
+
+import json, argparse, threading
+from time import perf_counter, sleep
+from concurrent.futures import ThreadPoolExecutor
+from engines import ENGINES, KEY_STRATEGIES, engine_names, open_engine
+from datagen import Dataset, add_scale_arg, bind_users
+from histogram import LatencyHistogram, merged
+from history import record_run
+
+ap = add_scale_arg(argparse.ArgumentParser())
+ap.add_argument("--strategies", default=",".join(KEY_STRATEGIES))
+ap.add_argument("--writers", default="1,8,32", help="concurrent writers, one connection each")
+ap.add_argument("--batches", type=int, default=20, help="batches per writer")
+ap.add_argument("--batch-size", type=int, default=100)
+ap.add_argument("--max-retries", type=int, default=10)
+args = ap.parse_args()
+STRATEGIES = args.strategies.split(",")
+WRITERS = [int(x) for x in args.writers.split(",")]
+
+N_USERS = int(1000 * args.scale)
+N_POSTS = int(10_000 * args.scale)
+BATCH = 1000
+HOT_SLICES = 16
+WINDOW_ROWS = 1000
+TABLES = {"users": "users_pk", "posts": "posts_pk"}
+
+ds = Dataset(N_USERS, N_POSTS, seed=SEED, prefix="upk")
+
+
+def writer(engine_name, strategy, w, user_ids, barrier):
+    conn = open_engine(engine_name, key_strategy=strategy, **TABLES)
+    batches = list(bind_users(ds.posts(args.batch_size, 0, args.batches * args.batch_size, stream=1 + w), user_ids))
+    hist, done, retries = LatencyHistogram(), [], 0
+    barrier.wait()
+    for batch in batches:
+        t0 = perf_counter()
+        for attempt in range(args.max_retries + 1):
+            try:
+                ids = conn.insert_posts(batch, returning=True)
+            except Exception as exc:
+                if attempt == args.max_retries or not conn.is_retryable(exc):
+                    raise
+                conn.rollback()
+                retries += 1
+                sleep(random.uniform(0, min(1.0, 0.002 * 2 ** attempt)))  # jittered exponential backoff
+                continue
+            break
+        t1 = perf_counter()
+        hist.record((t1 - t0) * 1000.0)
+        done.append((t1, ids))
+    conn.close()
+    return hist, done, retries
+
+
+def hotspots(order, seeded, done):
+    # Ranks of every post in key order; walk the batches in commit order
+    rank = {i: r for r, i in enumerate(order)}
+    edge = max((rank[i] for i in seeded), default=-1)
+    at_edge, placed = 0, []
+    for _, ids in sorted(done, key=lambda d: d[0]):
+        ranks = [rank[i] for i in ids]
+        at_edge += sum(r > edge for r in ranks)
+        edge = max([edge] + ranks)
+        placed += ranks
+    # Slices cut the pre-existing rows' key space; rows past its end count in the last
+    bounds = np.sort([rank[i] for i in seeded])
+    slices = np.minimum(np.searchsorted(bounds, placed) * HOT_SLICES // len(bounds), HOT_SLICES - 1)
+    windows = [slices[i:i + WINDOW_ROWS] for i in range(0, len(slices), WINDOW_ROWS)]
+    return {
+        "right_edge_share": at_edge / len(placed),
+        "hot_slice_share": float(np.mean([np.bincount(s, minlength=HOT_SLICES).max() / len(s) for s in windows])),
+    }
+
+
+def run_cell(e, n_writers):
+    e.create_tables(email=False, post_index="user_created")
+    user_ids = [i for batch in ds.users(BATCH, email=False) for i in e.insert_users(batch)]
+    seeded = []
+    for batch in bind_users(ds.posts(BATCH), user_ids):
+        seeded += e.insert_posts(batch, returning=True)
+
+    barrier = threading.Barrier(n_writers)
+    t0 = perf_counter()
+    with ThreadPoolExecutor(max_workers=n_writers) as ex:
+        out = list(ex.map(lambda w: writer(e.name, e.key_strategy, w, user_ids, barrier), range(n_writers)))
+    total_s = perf_counter() - t0
+
+    done = [d for o in out for d in o[1]]
+    hist = merged(o[0] for o in out)
+    rows = sum(len(ids) for _, ids in done)
+    return {
+        **hist.summary(),  # per batch
+        "rows_per_s": rows / total_s,
+        "rows": rows,
+        "retries": sum(o[2] for o in out),
+        **hotspots(e.primary_key_order("posts"), seeded, done),
+        "histogram": hist.to_dict(),
+    }
+
+
+results = {"consistency": {}}
+for name in engine_names():
+    results[name] = {}
+    for strategy in STRATEGIES:
+        if strategy not in ENGINES[name].key_strategies:
+            results[name][strategy] = {"supported": False}
+            print(f"{name:12s} {strategy:12s} not supported; skipped")
+            continue
+        e = open_engine(name, key_strategy=strategy, **TABLES)
+        results[name][strategy] = {}
+        results["consistency"][name] = e.consistency_settings()
+        for n_writers in WRITERS:
+            r = results[name][strategy][f"writers_{n_writers}"] = run_cell(e, n_writers)
+            print(f"{name:12s} {strategy:12s} writers={n_writers:<3d} {r['rows_per_s']:9,.0f} rows/s "
+                  f"batch p99={r['p99_ms']:.2f} ms right-edge={r['right_edge_share']:6.1%} "
+                  f"hot-slice={r['hot_slice_share']:6.1%} retries={r['retries']}")
+        results[name][strategy]["retries"] = sum(c["retries"] for c in results[name][strategy].values())
+        e.close()
+
+# ---------- Save ----------
+os.makedirs("results", exist_ok=True)
+results["seed"] = SEED
+results["scale"] = args.scale
+results["config"] = {"batches_per_writer": args.batches, "batch_size": args.batch_size,
+                     "hot_slices": HOT_SLICES, "window_rows": WINDOW_ROWS, "max_retries": args.max_retries}
+with open("results/key_results.json", "w") as f:
+    json.dump(results, f, indent=2)
+record_run("results/key_results.json")
+
+print("✅ Saved results to results/key_results.json")
@@ -0,0 +1,78 @@
+# --- Reproducible seeding (common block) ---
+import os, random
+import numpy as np
+from faker import Faker  # not used here, but kept for consistency
+
+SEED = int(os.environ.get("SEED", "42"))
+random.seed(SEED)
+np.random.seed(SEED)
+fake = Faker(); fake.seed_instance(SEED)
+print(f"SEED={SEED}")
+# ------------------------------------------
+
+# Open-loop point lookups: for each engine, step the target rate up until the
+# p99 SLO breaks and report the max sustainable throughput.
+# Reads the main users table, like run_concurrency_tests.py.
+
+import json, argparse, itertools
+from engines import open_engines
+from loadgen import ARRIVALS, arrival_schedule, run_open_loop, find_max_rate
+from distributions import KeyDistribution, add_distribution_args
+from history import record_run
+
+ap = add_distribution_args(argparse.ArgumentParser())
+ap.add_argument("--rates", default="500,1000,2000,4000,8000,16000", help="target QPS steps")
+ap.add_argument("--duration", type=float, default=10.0, help="seconds per step")
+ap.add_argument("--arrival", choices=ARRIVALS, default="poisson")
+ap.add_argument("--connections", type=int, default=32)
+ap.add_argument("--slo-p99-ms", type=float, default=10.0)
+args = ap.parse_args()
+RATES = [float(r) for r in args.rates.split(",")]
+DIST = KeyDistribution.from_args(args)
+
+# --- Same keyspace for every engine ---
+engines = open_engines()
+common = None
+for e in engines:
+    names = set(e.usernames())
+    common = names if common is None else common & names
+usernames = sorted(common or ())[:1000]
+if not usernames:
+    raise SystemExit("No common usernames across the selected engines. Run setup/tests first.")
+
+results = {}
+for idx, e in enumerate(engines):
+    # Deterministic per (engine, step): arrival gaps and lookup keys
+    step_rngs = (np.random.default_rng([SEED, idx, k]) for k in itertools.count())
+
+    def run_step(rate):
+        rng = next(step_rngs)
+        schedule = arrival_schedule(rate, args.duration, args.arrival, rng)
+        keys = DIST.sample(len(usernames), len(schedule), rng).tolist()
+        return run_open_loop(e, lambda conn, i: conn.point_lookup(usernames[keys[i]]), schedule, args.connections)
+
+    steps, best = find_max_rate(run_step, RATES, args.slo_p99_ms)
+    for s in steps:
+        print(f"{e.name:12s} target={s['target_qps']:>8,.0f} achieved={s['achieved_qps']:>8,.0f} "
+              f"p99={s.get('p99_ms', float('nan')):.2f} ms {'ok' if s['slo_ok'] else 'SLO broken'}")
+    results[e.name] = {"steps": steps, "max_sustainable_qps": best}
+
+# --- Save & cleanup ---
+os.makedirs("results", exist_ok=True)
+results["seed"] = SEED
+results["consistency"] = {e.name: e.consistency_settings() for e in engines}
+results["config"] = {
+    "arrival": args.arrival,
+    "duration_s": args.duration,
+    "connections": args.connections,
+    "slo_p99_ms": args.slo_p99_ms,
+    "distribution": DIST.to_dict(),
+}
+with open("results/open_loop_results.json", "w") as f:
+    json.dump(results, f, indent=2)
+record_run("results/open_loop_results.json")
+
+for e in engines:
+    e.close()
+
+print("✅ Saved results to results/open_loop_results.json")
@@ -0,0 +1,97 @@
+# --- Reproducible seeding (common block) ---
+import os, random
+import numpy as np
+from faker import Faker  # not used here, but kept for consistency
+
+SEED = int(os.environ.get("SEED", "42"))
+random.seed(SEED)
+np.random.seed(SEED)
+fake = Faker(); fake.seed_instance(SEED)
+print(f"SEED={SEED}")
+# ------------------------------------------
+
+# Infinite scroll: page through one heavy user's timeline to --pages deep,
+# once with keyset cursors (created_at, id) and once with OFFSET/skip, timing
+# every page. OFFSET re-reads all earlier rows on each page, so its per-page
+# latency grows with depth; keyset should stay flat. Both must return the
+# same pages (checked), ordered by (created_at DESC, id DESC) on an index
+# with the id tie-breaker.
+
+import json, argparse
+from time import perf_counter
+from engines import open_engines
+from datagen import Dataset, add_scale_arg, bind_users
+from histogram import LatencyHistogram
+from history import record_run
+
+ap = add_scale_arg(argparse.ArgumentParser())
+ap.add_argument("--page-size", type=int, default=20)
+ap.add_argument("--pages", type=int, default=2000, help="scroll depth; the scrolled user gets pages x page-size posts")
+args = ap.parse_args()
+
+N_USERS = int(1000 * args.scale)
+N_POSTS = int(10_000 * args.scale)  # background posts spread over all users
+SCROLL_USER_IDX = 0
+SCROLL_POSTS = args.pages * args.page_size
+DEPTH_BANDS = (1, 10, 100, 1_000, 10_000, 100_000)  # per-page latency summarized per [lo, hi) band
+BATCH = 1000
+
+engines = open_engines(users="users_p", posts="posts_p")
+# The scrolled user's posts are stream 1, background posts stream 0
+ds = Dataset(N_USERS, N_POSTS, seed=SEED, prefix="up")
+
+def row_id(row):
+    return row["_id"] if isinstance(row, dict) else row[0]
+
+def scroll(fetch):
+    # fetch(page_idx, last_row) -> rows; stops at the first empty page
+    per_page_ms, pages, last = [], [], None
+    for k in range(args.pages):
+        t0 = perf_counter()
+        rows = fetch(k, last)
+        per_page_ms.append((perf_counter() - t0) * 1000.0)
+        if not rows:
+            break
+        pages.append([row_id(r) for r in rows])
+        last = rows[-1]
+    by_depth = {}
+    for lo, hi in zip(DEPTH_BANDS[:-1], DEPTH_BANDS[1:]):
+        band = per_page_ms[lo - 1:hi - 1]
+        if band:
+            h = LatencyHistogram()
+            h.record_many(band)
+            by_depth[f"pages_{lo}_{hi - 1}"] = h.summary()
+    return {"pages": len(pages), "total_s": sum(per_page_ms) / 1000.0, "by_depth": by_depth, "per_page_ms": per_page_ms}, pages
+
+results = {}
+for e in engines:
+    e.create_tables(email=False, post_index="user_created_id")
+    user_ids = [i for batch in ds.users(BATCH, email=False) for i in e.insert_users(batch)]
+    for batch in bind_users(ds.posts(BATCH, stop=SCROLL_POSTS, stream=1, user_idx=SCROLL_USER_IDX), user_ids):
+        e.insert_posts(batch)
+    for batch in bind_users(ds.posts(BATCH), user_ids):
+        e.insert_posts(batch)
+
+    uid = user_ids[SCROLL_USER_IDX]
+    keyset, keyset_pages = scroll(lambda k, last: e.page_after(uid, last, args.page_size))
+    offset, offset_pages = scroll(lambda k, last: e.page_offset(uid, k * args.page_size, args.page_size))
+    results[e.name] = {"keyset": keyset, "offset": offset, "pages_match": keyset_pages == offset_pages}
+
+    deepest = list(keyset["by_depth"])[-1]
+    print(f"{e.name:12s} {keyset['pages']} pages | {deepest}: keyset p50={keyset['by_depth'][deepest]['p50_ms']:.2f} ms "
+          f"offset p50={offset['by_depth'][deepest]['p50_ms']:.2f} ms | match={results[e.name]['pages_match']}")
+
+# ---------- Save & cleanup ----------
+os.makedirs("results", exist_ok=True)
+results["seed"] = SEED
+results["consistency"] = {e.name: e.consistency_settings() for e in engines}
+results["scale"] = args.scale
+results["config"] = {"page_size": args.page_size, "pages": args.pages, "scroll_posts": SCROLL_POSTS}
+with open("results/pagination_results.json", "w") as f:
+    json.dump(results, f, indent=2)
+record_run("results/pagination_results.json")
+
+for e in engines:
+    e.close()
+
+print("✅ Saved results to results/pagination_results.json")
@@ -0,0 +1,90 @@
+# --- Reproducible seeding (common block) ---
+import os, random
+import numpy as np
+from faker import Faker  # not used here, but kept for consistency
+
+SEED = int(os.environ.get("SEED", "42"))
+random.seed(SEED)
+np.random.seed(SEED)
+fake = Faker(); fake.seed_instance(SEED)
+print(f"SEED={SEED}")
+# ------------------------------------------
+
+# Payload size x projection: for each post content size (and optional JSON
+# "meta" media blob, JSONB on CockroachDB / embedded on Mongo), read the
+# latest-20 posts of sampled users either as full rows (SELECT *, unprojected
+# find) or index-only (covered by the (user_id, created_at) index), recording
+# latency and the approximate bytes each result carries. Latency includes the
+# Python driver decoding the result.
+
+import json, argparse
+from time import perf_counter
+from engines import open_engines
+from datagen import Dataset, add_scale_arg, bind_users
+from distributions import KeyDistribution, add_distribution_args
+from histogram import LatencyHistogram
+from history import record_run
+
+ap = add_distribution_args(add_scale_arg(argparse.ArgumentParser()))
+ap.add_argument("--content-bytes", default="100,1024,8192,65536", help="post content sizes")
+ap.add_argument("--meta-bytes", default="0,4096", help="JSON meta blob sizes (0 = no blob column)")
+ap.add_argument("--reps", type=int, default=200)
+args = ap.parse_args()
+CONTENT_BYTES = [int(x) for x in args.content_bytes.split(",")]
+META_BYTES = [int(x) for x in args.meta_bytes.split(",")]
+DIST = KeyDistribution.from_args(args)
+
+# Few posts per user-size combo: 65 KB x N_POSTS is what each fixture holds
+N_USERS = int(100 * args.scale)
+N_POSTS = int(2000 * args.scale)
+LATEST_N = 20
+BATCH = 500
+
+keys = DIST.sample(N_USERS, args.reps, np.random.default_rng([SEED, 1])).tolist()
+
+def measure(fn, uids, engine):
+    hist, total_bytes = LatencyHistogram(), 0
+    for uid in uids:
+        t0 = perf_counter()
+        rows = fn(uid, LATEST_N)
+        hist.record((perf_counter() - t0) * 1000.0)
+        total_bytes += engine.result_bytes(rows)  # outside the timed region
+    return {**hist.summary(), "bytes_per_query": total_bytes / len(uids)}
+
+engines = open_engines(users="users_pl", posts="posts_pl")
+results = {e.name: {} for e in engines}
+for content_bytes in CONTENT_BYTES:
+    for meta_bytes in META_BYTES:
+        ds = Dataset(N_USERS, N_POSTS, seed=SEED, prefix="upl", content_bytes=content_bytes, meta_bytes=meta_bytes)
+        for e in engines:
+            e.create_tables(email=False, post_index="user_created", meta=meta_bytes > 0)
+            user_ids = [i for batch in ds.users(BATCH, email=False) for i in e.insert_users(batch)]
+            t0 = perf_counter()
+            for batch in bind_users(ds.posts(BATCH), user_ids):
+                e.insert_posts(batch)
+            load_s = perf_counter() - t0
+
+            uids = [user_ids[k] for k in keys]
+            r = results[e.name][f"content_{content_bytes}_meta_{meta_bytes}"] = {
+                "load_s": load_s,
+                "full": measure(e.latest_full, uids, e),
+                "covered": measure(e.latest_covered, uids, e),
+            }
+            print(f"{e.name:12s} content={content_bytes:<6d} meta={meta_bytes:<5d} "
+                  f"full p99={r['full']['p99_ms']:.2f} ms ({r['full']['bytes_per_query'] / 1024:,.1f} KB) "
+                  f"covered p99={r['covered']['p99_ms']:.2f} ms ({r['covered']['bytes_per_query'] / 1024:,.1f} KB)")
+
+# ---------- Save & cleanup ----------
+os.makedirs("results", exist_ok=True)
+results["seed"] = SEED
+results["consistency"] = {e.name: e.consistency_settings() for e in engines}
+results["scale"] = args.scale
+results["config"] = {"latest_n": LATEST_N, "reps": args.reps, "posts": N_POSTS, "distribution": DIST.to_dict()}
+with open("results/payload_results.json", "w") as f:
+    json.dump(results, f, indent=2)
+record_run("results/payload_results.json")
+
+for e in engines:
+    e.close()
+
+print("✅ Saved results to results/payload_results.json")
@@ -0,0 +1,110 @@
+# --- Reproducible seeding (common block) ---
+import os, random
+import numpy as np
+from faker import Faker  # not used here, but kept for consistency
+
+SEED = int(os.environ.get("SEED", "42"))
+random.seed(SEED)
+np.random.seed(SEED)
+fake = Faker(); fake.seed_instance(SEED)
+print(f"SEED={SEED}")
+# ------------------------------------------
+
+# Prepared vs. unprepared statements for point lookups and latest-20.
+# CockroachDB: PREPARE once per connection + EXECUTE per call, against
+# psycopg2's default of a client-interpolated simple query parsed and planned
+# from scratch every time. SQLite stand-in: sqlite3's statement cache on/off.
+# Engines without prepared statements (Mongo) are recorded as unsupported.
+# Modes alternate for --rounds rounds so drift hits both equally; reports
+# per-op latency, throughput and client CPU per op.
+
+import json, argparse
+from time import perf_counter, process_time
+from engines import open_engines, open_engine
+from datagen import Dataset, add_scale_arg, bind_users
+from distributions import KeyDistribution, add_distribution_args
+from histogram import LatencyHistogram
+from history import record_run
+
+ap = add_distribution_args(add_scale_arg(argparse.ArgumentParser()))
+ap.add_argument("--ops", type=int, default=2000, help="operations per workload, mode and round")
+ap.add_argument("--rounds", type=int, default=3)
+ap.add_argument("--warmup", type=int, default=200)
+args = ap.parse_args()
+DIST = KeyDistribution.from_args(args)
+
+N_USERS = int(1000 * args.scale)
+N_POSTS = int(10_000 * args.scale)
+BATCH = 1000
+TABLES = {"users": "users_ps", "posts": "posts_ps"}
+MODES = {"unprepared": False, "prepared": True}
+
+ds = Dataset(N_USERS, N_POSTS, seed=SEED, prefix="ups")
+usernames = [u["username"] for batch in ds.users(BATCH, email=False) for u in batch]
+keys = DIST.sample(N_USERS, args.ops, np.random.default_rng([SEED, 1])).tolist()
+
+WORKLOADS = {
+    "point_lookup": lambda conn, user_ids, k: conn.point_lookup(usernames[k]),
+    "latest20": lambda conn, user_ids, k: conn.latest_n(user_ids[k], 20),
+}
+
+engines = open_engines(**TABLES)
+results = {}
+for e in engines:
+    if not e.supports_prepared:
+        results[e.name] = {"supported": False}
+        print(f"{e.name:12s} no prepared statements; skipped")
+        continue
+
+    e.create_tables(email=False, post_index="user_created")
+    user_ids = [i for batch in ds.users(BATCH, email=False) for i in e.insert_users(batch)]
+    for batch in bind_users(ds.posts(BATCH), user_ids):
+        e.insert_posts(batch)
+
+    # One long-lived connection per mode: statements stay prepared across rounds
+    conns = {mode: open_engine(e.name, prepared=flag, **TABLES) for mode, flag in MODES.items()}
+    stats = {w: {m: {"hist": LatencyHistogram(), "cpu_s": 0.0, "wall_s": 0.0} for m in MODES} for w in WORKLOADS}
+    for conn in conns.values():
+        for k in keys[:args.warmup]:
+            for op in WORKLOADS.values():
+                op(conn, user_ids, k)
+
+    for _ in range(args.rounds):
+        for w, op in WORKLOADS.items():
+            for mode, conn in conns.items():
+                s = stats[w][mode]
+                cpu0, wall0 = process_time(), perf_counter()
+                for k in keys:
+                    t0 = perf_counter()
+                    op(conn, user_ids, k)
+                    s["hist"].record((perf_counter() - t0) * 1000.0)
+                s["cpu_s"] += process_time() - cpu0
+                s["wall_s"] += perf_counter() - wall0
+
+    results[e.name] = {"supported": True}
+    for w in WORKLOADS:
+        r = results[e.name][w] = {}
+        for mode, s in stats[w].items():
+            n = s["hist"].count
+            r[mode] = {**s["hist"].summary(), "throughput_qps": n / s["wall_s"], "client_cpu_us_per_op": s["cpu_s"] / n * 1e6}
+        r["p50_speedup"] = r["unprepared"]["p50_ms"] / r["prepared"]["p50_ms"]
+        print(f"{e.name:12s} {w:12s} p50 {r['unprepared']['p50_ms']:.3f} -> {r['prepared']['p50_ms']:.3f} ms "
+              f"(x{r['p50_speedup']:.2f}), client CPU {r['unprepared']['client_cpu_us_per_op']:.0f} -> "
+              f"{r['prepared']['client_cpu_us_per_op']:.0f} us/op")
+    for conn in conns.values():
+        conn.close()
+
+# ---------- Save & cleanup ----------
+os.makedirs("results", exist_ok=True)
+results["seed"] = SEED
+results["consistency"] = {e.name: e.consistency_settings() for e in engines}
+results["scale"] = args.scale
+results["config"] = {"ops": args.ops, "rounds": args.rounds, "warmup": args.warmup, "distribution": DIST.to_dict()}
+with open("results/prepared_results.json", "w") as f:
+    json.dump(results, f, indent=2)
+record_run("results/prepared_results.json")
+
+for e in engines:
+    e.close()
+
+print("✅ Saved results to results/prepared_results.json")
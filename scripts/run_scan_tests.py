@@ -0,0 +1,108 @@
+# --- Reproducible seeding (common block) ---
+import os, random
+import numpy as np
+from faker import Faker  # not used here, but kept for consistency
+
+SEED = int(os.environ.get("SEED", "42"))
+random.seed(SEED)
+np.random.seed(SEED)
+fake = Faker(); fake.seed_instance(SEED)
+print(f"SEED={SEED}")
+# ------------------------------------------
+
+# Export-style large scan: read every post (hundreds of thousands of rows)
+# either materialized (list(cursor) / fetchall) or streamed with a cursor
+# batch size (Mongo batch_size, CockroachDB named cursor + itersize), and
+# report time-to-first-row, total time and peak client RSS. Each variant runs
+# in its own forked process so ru_maxrss is that variant's peak alone.
+
+import json, argparse, resource
+from time import perf_counter
+from datetime import timedelta
+from concurrent.futures import ProcessPoolExecutor
+from engines import open_engines, open_engine
+from datagen import DAYS, Dataset, add_scale_arg, bind_users
+from history import record_run
+
+TABLES = {"users": "users_s", "posts": "posts_s"}
+BATCH = 1000
+
+def _rss_mb():
+    return resource.getrusage(resource.RUSAGE_SELF).ru_maxrss / 1024.0  # KB on Linux
+
+def scan_variant(engine_name, batch_size, since):
+    # batch_size None = materialize everything
+    e = open_engine(engine_name, **TABLES)
+    rss0 = _rss_mb()
+    t0 = perf_counter()
+    ttfr, n, content_bytes = None, 0, 0
+    if batch_size is None:
+        rows = e.scan_since(since)
+        ttfr = perf_counter() - t0
+        for row in rows:
+            n += 1
+            content_bytes += len(row["content"] if isinstance(row, dict) else row[2])
+        del rows
+    else:
+        for row in e.stream_since(since, batch_size):
+            if ttfr is None:
+                ttfr = perf_counter() - t0
+            n += 1
+            content_bytes += len(row["content"] if isinstance(row, dict) else row[2])
+    total_s = perf_counter() - t0
+    e.close()
+    peak = _rss_mb()
+    return {
+        "rows": n,
+        "ttfr_ms": ttfr * 1000.0 if ttfr is not None else None,
+        "total_s": total_s,
+        "rows_per_s": n / total_s,
+        "peak_rss_mb": peak,
+        "rss_growth_mb": peak - rss0,
+        "content_bytes": content_bytes,
+    }
+
+def in_fresh_process(fn, *args):
+    with ProcessPoolExecutor(max_workers=1) as ex:
+        return ex.submit(fn, *args).result()
+
+if __name__ == "__main__":
+    ap = add_scale_arg(argparse.ArgumentParser())
+    ap.add_argument("--batch-sizes", default="100,1000,10000", help="cursor batch sizes to stream with")
+    args = ap.parse_args()
+    BATCH_SIZES = [int(x) for x in args.batch_sizes.split(",")]
+
+    N_USERS = int(1000 * args.scale)
+    N_POSTS = int(300_000 * args.scale)
+    ds = Dataset(N_USERS, N_POSTS, seed=SEED, prefix="us")
+    since = ds.anchor - timedelta(days=DAYS)  # the whole table
+
+    engines = open_engines(**TABLES)
+    results = {e.name: {} for e in engines}
+    for e in engines:
+        # ---------- Fixture (bulk path, no secondary index: a full scan) ----------
+        e.create_tables(email=False, post_index=None)
+        user_ids = [i for batch in ds.users(BATCH, email=False) for i in e.insert_users(batch)]
+        e.bulk_load_posts(p for batch in bind_users(ds.posts(BATCH), user_ids) for p in batch)
+
+        # ---------- Materialized vs. streamed ----------
+        for batch_size in [None] + BATCH_SIZES:
+            key = "fetchall" if batch_size is None else f"batch_{batch_size}"
+            r = results[e.name][key] = in_fresh_process(scan_variant, e.name, batch_size, since)
+            print(f"{e.name:12s} {key:12s} rows={r['rows']:,} ttfr={r['ttfr_ms']:.1f} ms total={r['total_s']:.2f}s "
+                  f"rss +{r['rss_growth_mb']:.0f} MB (peak {r['peak_rss_mb']:.0f} MB)")
+
+    # ---------- Save & cleanup ----------
+    os.makedirs("results", exist_ok=True)
+    results["seed"] = SEED
+    results["consistency"] = {e.name: e.consistency_settings() for e in engines}
+    results["scale"] = args.scale
+    results["config"] = {"posts": N_POSTS, "batch_sizes": BATCH_SIZES}
+    with open("results/scan_results.json", "w") as f:
+        json.dump(results, f, indent=2)
+    record_run("results/scan_results.json")
+
+    for e in engines:
+        e.close()
+
+    print("✅ Saved results to results/scan_results.json")
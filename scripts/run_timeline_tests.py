@@ -0,0 +1,133 @@
+# --- Reproducible seeding (common block) ---
+import os, random
+import numpy as np
+from faker import Faker  # not used here, but kept for consistency
+
+SEED = int(os.environ.get("SEED", "42"))
+random.seed(SEED)
+np.random.seed(SEED)
+fake = Faker(); fake.seed_instance(SEED)
+print(f"SEED={SEED}")
+# ------------------------------------------
+
+# Home timeline (latest N posts from everyone a user follows, with like counts)
+# over a power-law follower graph, two ways:
+#   fan-out-on-read   join follows -> posts at read time (home_timeline)
+#   fan-out-on-write  read a per-user inbox materialized when posts are
+#                     written (inbox_timeline / publish_posts)
+# Reports read latency for both, the inbox backfill cost, and the per-post
+# write cost of plain inserts vs. inserts that fan out to every follower.
+
+import json, argparse
+from time import perf_counter
+from engines import open_engines
+from datagen import AVG_FOLLOWS, Dataset, add_scale_arg, batched, bind_users
+from distributions import KeyDistribution, add_distribution_args
+from histogram import LatencyHistogram
+from history import record_run
+
+ap = add_distribution_args(add_scale_arg(argparse.ArgumentParser()))
+ap.add_argument("--avg-follows", type=float, default=AVG_FOLLOWS, help="mean accounts followed per user")
+ap.add_argument("--likes-per-post", type=float, default=5.0)
+ap.add_argument("--timeline-n", type=int, default=50)
+ap.add_argument("--reps", type=int, default=500, help="timeline reads per variant")
+ap.add_argument("--new-posts", type=int, default=1000, help="posts written per write path")
+args = ap.parse_args()
+DIST = KeyDistribution.from_args(args)  # which users open their timeline
+
+N_USERS = int(1000 * args.scale)
+N_POSTS = int(10_000 * args.scale)
+BATCH = 1000
+CHECK_USERS = 20  # timelines compared between the two read paths
+
+engines = open_engines(users="users_t", posts="posts_t", follows="follows_t", likes="likes_t", inbox="inbox_t")
+ds = Dataset(N_USERS, N_POSTS, seed=SEED, prefix="ut")
+follower_idx, followee_idx = ds.follows(args.avg_follows)
+like_user_idx, like_post_idx = ds.likes(int(N_POSTS * args.likes_per_post))
+n_followers = np.bincount(followee_idx, minlength=N_USERS)
+n_following = np.bincount(follower_idx, minlength=N_USERS)
+readers = DIST.sample(N_USERS, args.reps, np.random.default_rng([SEED, 1])).tolist()
+
+# New posts for the write comparison (stream 1); each fans out to its author's followers
+new_posts = list(ds.iter_posts(stop=args.new_posts, stream=1))
+fanout_rows = int(n_followers[[p["user_idx"] for p in new_posts]].sum())
+
+def timed(fn, *a):
+    t0 = perf_counter()
+    fn(*a)
+    return perf_counter() - t0
+
+def read_all(fn, uids):
+    hist = LatencyHistogram()
+    for uid in uids:
+        t0 = perf_counter()
+        fn(uid, args.timeline_n)
+        hist.record((perf_counter() - t0) * 1000.0)
+    return hist.summary()
+
+def timeline_key(rows):
+    # Engine-neutral (id, created_at, likes) per post
+    return [(r["_id"], str(r["created_at"]), r["likes"]) if isinstance(r, dict) else (r[0], str(r[3]), r[4]) for r in rows]
+
+results = {}
+for e in engines:
+    r = results[e.name] = {}
+
+    # ---------- Fixture: users, posts, follows, likes ----------
+    e.create_tables(email=False, post_index="user_created", social=True)
+    user_ids = [i for batch in ds.users(BATCH, email=False) for i in e.insert_users(batch)]
+    for batch in bind_users(ds.posts(BATCH), user_ids):
+        e.insert_posts(batch)
+    post_ids = e.sample_ids("posts", N_POSTS)
+
+    follows = ((user_ids[a], user_ids[b]) for a, b in zip(follower_idx.tolist(), followee_idx.tolist()))
+    r["insert_follows_s"] = sum(timed(e.insert_follows, batch) for batch in batched(follows, 10 * BATCH))
+    likes = ((user_ids[u], post_ids[p]) for u, p in zip(like_user_idx.tolist(), like_post_idx.tolist()))
+    r["insert_likes_s"] = sum(timed(e.insert_likes, batch) for batch in batched(likes, 10 * BATCH))
+
+    # ---------- Fan-out-on-write backfill ----------
+    r["inbox_backfill_s"] = timed(e.build_inboxes)
+
+    # ---------- Reads ----------
+    uids = [user_ids[k] for k in readers]
+    r["fanout_on_read"] = read_all(e.home_timeline, uids)
+    r["fanout_on_write"] = read_all(e.inbox_timeline, uids)
+    r["timelines_match"] = all(
+        timeline_key(e.home_timeline(uid, args.timeline_n)) == timeline_key(e.inbox_timeline(uid, args.timeline_n))
+        for uid in uids[:CHECK_USERS]
+    )
+
+    # ---------- Writes: the same new posts down both paths ----------
+    write_s = sum(timed(e.insert_posts, b) for b in bind_users(batched(new_posts, BATCH), user_ids))
+    publish_s = sum(timed(e.publish_posts, b) for b in bind_users(batched(new_posts, BATCH), user_ids))
+    r["write_fanout_on_read_ms_per_post"] = write_s / len(new_posts) * 1000.0
+    r["write_fanout_on_write_ms_per_post"] = publish_s / len(new_posts) * 1000.0
+
+    print(f"{e.name:12s} read p99: on-read={r['fanout_on_read']['p99_ms']:.2f} ms on-write={r['fanout_on_write']['p99_ms']:.2f} ms | "
+          f"write/post: {r['write_fanout_on_read_ms_per_post']:.3f} vs {r['write_fanout_on_write_ms_per_post']:.3f} ms | "
+          f"match={r['timelines_match']}")
+
+# ---------- Save & cleanup ----------
+os.makedirs("results", exist_ok=True)
+results["seed"] = SEED
+results["consistency"] = {e.name: e.consistency_settings() for e in engines}
+results["scale"] = args.scale
+results["graph"] = {
+    "users": N_USERS,
+    "posts": N_POSTS,
+    "follows": int(len(follower_idx)),
+    "likes": int(len(like_user_idx)),
+    "max_followers": int(n_followers.max()),
+    "median_followers": float(np.median(n_followers)),
+    "max_following": int(n_following.max()),
+    "inbox_rows_per_new_post": fanout_rows / len(new_posts),
+}
+results["config"] = {"timeline_n": args.timeline_n, "reps": args.reps, "distribution": DIST.to_dict()}
+with open("results/timeline_results.json", "w") as f:
+    json.dump(results, f, indent=2)
+record_run("results/timeline_results.json")
+
+for e in engines:
+    e.close()
+
+print("✅ Saved results to results/timeline_results.json")
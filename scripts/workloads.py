@@ -0,0 +1,73 @@
+# --- Named mixed read/write workloads (YCSB-style) over the social schema ---
+# Each workload is an operation mix; MixedWorkload pre-draws the operation
+# type and keys for every request up front, so the timed loop only indexes
+# arrays. An instance is the op(conn, i) callable run by loadgen.run_open_loop
+# (pass kinds/kind_names for the per-operation latency breakdown). Users and
+# posts are picked with a distributions.KeyDistribution (uniform by default).
+# ------------------------------------------
+
+from datetime import datetime
+from distributions import KeyDistribution
+
+WORKLOADS = {
+    "A": ("update heavy: 50% post read / 50% post update", {"read_post": 50, "update_post": 50}),
+    "B": ("read-mostly timeline: 95% latest-20 / 5% new posts + comments",
+          {"timeline": 95, "insert_post": 2, "add_comment": 3}),
+    "C": ("read only: user lookup + post read", {"read_user": 50, "read_post": 50}),
+    "E": ("short range scans: 95% latest-N posts (N<=50) / 5% new posts", {"scan": 95, "insert_post": 5}),
+    "F": ("read-modify-write: 50% post read / 50% read-then-update", {"read_post": 50, "rmw": 50}),
+}
+MAX_SCAN = 50
+
+
+class MixedWorkload:
+    def __init__(self, name, n_ops, fixture, rng, dist=None):
+        # fixture: one engine's "user_ids", "usernames", "post_ids" and a pool
+        # of "contents" for writes; rng: numpy Generator (seed-stable draws).
+        dist = dist or KeyDistribution()
+        self.name = name
+        self.description, mix = WORKLOADS[name]
+        self.kind_names = list(mix)
+        weights = [mix[k] for k in self.kind_names]
+        self.kinds = rng.choice(len(weights), n_ops, p=[w / sum(weights) for w in weights]).tolist()
+        self.user_ids, self.usernames = fixture["user_ids"], fixture["usernames"]
+        self.post_ids, self.contents = fixture["post_ids"], fixture["contents"]
+        self.user_keys = dist.sample(len(self.user_ids), n_ops, rng).tolist()
+        self.post_keys = dist.sample(len(self.post_ids), n_ops, rng).tolist()
+        self.scan_len = rng.integers(1, MAX_SCAN + 1, n_ops).tolist()
+        self.ops = [getattr(self, "_" + k) for k in self.kind_names]
+
+    def __call__(self, conn, i):
+        return self.ops[self.kinds[i]](conn, i)
+
+    def _content(self, i):
+        return self.contents[i % len(self.contents)]
+
+    # ---------- Operations ----------
+    def _read_user(self, conn, i):
+        return conn.point_lookup(self.usernames[self.user_keys[i]])
+
+    def _read_post(self, conn, i):
+        return conn.get_post(self.post_ids[self.post_keys[i]])
+
+    def _update_post(self, conn, i):
+        conn.update_post(self.post_ids[self.post_keys[i]], self._content(i))
+
+    def _rmw(self, conn, i):
+        post_id = self.post_ids[self.post_keys[i]]
+        conn.get_post(post_id)
+        conn.update_post(post_id, self._content(i))
+
+    def _timeline(self, conn, i):
+        return conn.latest_n(self.user_ids[self.user_keys[i]], 20)
+
+    def _scan(self, conn, i):
+        return conn.latest_n(self.user_ids[self.user_keys[i]], self.scan_len[i])
+
+    def _insert_post(self, conn, i):
+        conn.insert_posts([{"user_id": self.user_ids[self.user_keys[i]], "content": self._content(i),
+                            "created_at": datetime.utcnow()}])
+
+    def _add_comment(self, conn, i):
+        conn.insert_comments([{"post_id": self.post_ids[self.post_keys[i]], "user_id": self.user_ids[self.user_keys[i]],
+                               "content": self._content(i), "created_at": datetime.utcnow()}])